@@ -0,0 +1,390 @@
+"""
+Benchmarks for the storage and validation hot paths. Every run works in a
+temporary directory and prints one JSON document, so results of two runs can
+be compared with any JSON tool:
+
+    python benchmarks.py --output before.json
+    python benchmarks.py --quick --only verified
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import data_manager
+import history_model
+import wikipedia_scraper
+from config import CATEGORIES
+
+TERM_COUNTS = [1_000, 100_000, 1_000_000]
+HISTORY_SIZES = [1_000, 10_000, 100_000]
+LETTERS = "ABCDEFGHIJKLMNOPRSTUVWZ"
+
+logger = logging.getLogger("benchmarks")
+
+# Lead sections in the style of German Wikipedia summaries
+SUMMARIES = {
+    "Donau": "Die Donau ist mit einer Länge von 2857 Kilometern nach der Wolga der zweitlängste Fluss in Europa. Sie entspringt im Schwarzwald und mündet in das Schwarze Meer.",
+    "Berlin": "Berlin ist die Hauptstadt und ein Land der Bundesrepublik Deutschland. Die Großstadt ist mit rund 3,7 Millionen Einwohnern die bevölkerungsreichste Gemeinde Deutschlands.",
+    "Oman": "Oman ist ein Staat in Vorderasien im Osten der Arabischen Halbinsel. Das Sultanat grenzt an Saudi-Arabien, Jemen und die Vereinigten Arabischen Emirate.",
+    "Rose": "Die Rosen sind die Namensgebende Pflanzengattung der Familie der Rosengewächse. Die etwa 100 bis 250 Arten sind sommergrüne Sträucher.",
+    "Fuchs": "Der Rotfuchs ist der bekannteste und am weitesten verbreitete Vertreter der Füchse. Er ist ein Raubtier aus der Familie der Hunde und lebt in Europa, Asien und Nordamerika.",
+    "Goethe": "Johann Wolfgang von Goethe war ein deutscher Dichter und Naturforscher. Er gilt als einer der bedeutendsten Schöpfer deutschsprachiger Dichtung.",
+    "Mars (Planet)": "Der Mars ist, von der Sonne aus gezählt, der vierte Planet im Sonnensystem und der äußere Nachbar der Erde.",
+    "Mars (Gott)": "Mars ist der römische Gott des Krieges und nach Jupiter der wichtigste Gott der Römer.",
+}
+DISAMBIGUATIONS = {
+    "Mars": "<ul><li><a>Mars (Planet)</a>, ein Planet</li><li><a>Mars (Gott)</a>, ein Gott</li></ul>"
+}
+REDIRECTS = {"Berlin (Stadt)": "Berlin"}
+SUGGESTIONS = {"Dunau": "Donau"}  # Search suggestions for misspelled queries
+VALIDATION_CASES = [
+    ("Donau", "River"),
+    ("Berlin", "City"),
+    ("Oman", "Country"),
+    ("Rose", "Plant"),
+    ("Fuchs", "Animal"),
+    ("Goethe", "City"),
+    ("Mars", "Country"),
+    ("Unbekannt", "River"),
+]
+
+
+# === Measurement ===
+def _measure(name, params, func, repeat=5, number=1, setup=None):
+    """
+    Times func() `number` times per run for `repeat` runs and returns a result
+    record with per-call seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    result = {
+        "name": name,
+        "params": params,
+        "repeat": repeat,
+        "number": number,
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+    }
+    logger.info(f"{name} {params}: median {result['median_s'] * 1e6:.1f} µs")
+    return result
+
+
+def _git_revision():
+    """Returns the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# === Synthetic data ===
+def _write_verified_terms(count):
+    """Writes a verified terms CSV with `count` unique synthetic terms."""
+    with open(data_manager.VERIFIED_TERMS_FILE, "w", encoding="utf-8") as f:
+        f.write("Term,Category\n")
+        for i in range(count):
+            f.write(f"Term{i},{CATEGORIES[i % len(CATEGORIES)]}\n")
+
+
+def _random_round(rng, day):
+    """Returns a synthetic round in the shape Game.save_final_results produces."""
+    letter = rng.choice(LETTERS)
+    data = {"Letter": letter, "Date": day.strftime(history_model.DATE_FORMAT)}
+    for category in CATEGORIES:
+        data[category] = (
+            f"{letter}{rng.randrange(10_000)}" if rng.random() < 0.7 else ""
+        )
+    data["Points"] = 10 * sum(1 for category in CATEGORIES if data[category])
+    return data
+
+
+def _write_history(size, rng):
+    """Writes a synthetic history with `size` rounds spread over recent days."""
+    columns = data_manager._ordered_columns(["Date", "Letter", *CATEGORIES, "Points"])
+    start = date.today() - timedelta(days=size // 20)
+    table = history_model.HistoryTable(columns)
+    for i in range(size):
+        table.append(_random_round(rng, start + timedelta(days=i // 20)))
+    history_model.write_history(table, data_manager.HISTORY_FILE)
+    data_manager.history_store.invalidate()
+    data_manager._game_stats = None
+
+
+# === Benchmarks ===
+def bench_verified_terms(counts):
+    """is_term_verified (hits and misses) and add_verified_term per cache size."""
+    results = []
+    for count in counts:
+        _write_verified_terms(count)
+        params = {"terms": count}
+        results.append(
+            _measure("load_verified_terms", params, data_manager.load_verified_terms, 3)
+        )
+        indices = [i * 7919 % count for i in range(1_000)]
+        probes = [(f"term{i}", CATEGORIES[i % len(CATEGORIES)]) for i in indices]
+        misses = [(f"Missing{i}", CATEGORIES[0]) for i in range(1_000)]
+        results.append(
+            _measure(
+                "is_term_verified_hit",
+                params,
+                lambda: [data_manager.is_term_verified(*p) for p in probes],
+            )
+        )
+        results.append(
+            _measure(
+                "is_term_verified_miss",
+                params,
+                lambda: [data_manager.is_term_verified(*p) for p in misses],
+            )
+        )
+        new_terms = iter(range(10**9))
+        results.append(
+            _measure(
+                "add_verified_term",
+                params,
+                lambda: data_manager.add_verified_term(
+                    f"New{next(new_terms)}", CATEGORIES[0]
+                ),
+                number=100,
+            )
+        )
+    return results
+
+
+def bench_history(sizes):
+    """save_results_to_csv and get_games_by_letter on growing histories."""
+    results = []
+    rng = random.Random(42)
+    for size in sizes:
+        _write_history(size, rng)
+        params = {"games": size}
+
+        def cold_load():
+            data_manager.history_store.invalidate()
+            data_manager.get_games_by_letter("A")
+
+        results.append(_measure("get_games_by_letter_cold", params, cold_load, 3))
+        results.append(
+            _measure(
+                "get_games_by_letter_warm",
+                params,
+                lambda: data_manager.get_games_by_letter(rng.choice(LETTERS)),
+                number=50,
+            )
+        )
+        results.append(
+            _measure(
+                "save_results_to_csv",
+                params,
+                lambda: data_manager.save_results_to_csv(
+                    _random_round(rng, date.today())
+                ),
+                number=20,
+            )
+        )
+    return results
+
+
+def bench_keywords():
+    """check_summary_for_keywords on realistic summaries."""
+    summaries = list(SUMMARIES.values())
+
+    def check_all():
+        for summary in summaries:
+            for category in CATEGORIES:
+                wikipedia_scraper.check_summary_for_keywords(
+                    summary, category, "term", is_checking_option=True
+                )
+
+    params = {"summaries": len(summaries), "categories": len(CATEGORIES)}
+    return [
+        _measure("check_summary_for_keywords", params, check_all, number=200),
+    ]
+
+
+class _StubWikipedia(BaseHTTPRequestHandler):
+    """
+    Answers the MediaWiki queries wiki_client sends from SUMMARIES. Requests are
+    recorded in server.queries, and (status, headers, body) entries queued in
+    server.failures are sent before any regular answer.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        query = {
+            key: values[0]
+            for key, values in parse_qs(
+                urlparse(self.path).query, keep_blank_values=True
+            ).items()
+        }
+        self.server.queries.append(query)
+        if self.server.failures:
+            status, headers, body = self.server.failures.pop(0)
+        else:
+            status, headers, body = 200, {}, self._answer(query)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _answer(self, query):
+        """Builds the JSON answer to a query."""
+        if query.get("action") == "parse":
+            return {"parse": {"text": {"*": DISAMBIGUATIONS[query["page"]]}}}
+        if query.get("list") == "search":
+            prefix = query["srsearch"][:3].lower()
+            titles = [t for t in SUMMARIES if t.lower().startswith(prefix)]
+            info = {}
+            if query["srsearch"] in SUGGESTIONS:
+                info["suggestion"] = SUGGESTIONS[query["srsearch"]]
+            return {
+                "query": {
+                    "searchinfo": info,
+                    "search": [{"title": t} for t in titles],
+                }
+            }
+        title = REDIRECTS.get(query["titles"], query["titles"])
+        if title in DISAMBIGUATIONS:
+            page = {"pageid": 1, "title": title, "pageprops": {"disambiguation": ""}}
+        elif title in SUMMARIES:
+            page = {"pageid": 2, "title": title, "extract": SUMMARIES[title]}
+        else:
+            page = {"title": title, "missing": ""}
+        return {"query": {"pages": {str(page.get("pageid", -1)): page}}}
+
+
+def start_stub_server():
+    """Serves _StubWikipedia on a free local port from a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubWikipedia)
+    server.daemon_threads = True
+    server.queries = []
+    server.failures = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_validation():
+    """validate_input against a local stub server, with a cold and a warm cache."""
+    try:
+        import requests  # noqa: F401  (wiki_client needs it for the stub run)
+    except ImportError:
+        return [{"name": "validate_input", "skipped": "requests is not installed"}]
+    import response_cache
+    import wiki_client
+
+    server = start_stub_server()
+    wiki_client.WIKIPEDIA_API_URL = f"http://127.0.0.1:{server.server_port}/w/api.php"
+    wiki_client.rate_limiter.rate = 0
+
+    def validate_all():
+        for term, category in VALIDATION_CASES:
+            wikipedia_scraper.validate_input(term, category)
+
+    def classify_all():
+        for term, _ in VALIDATION_CASES:
+            wikipedia_scraper.classify_term(term)
+
+    params = {"terms": len(VALIDATION_CASES)}
+    try:
+        return [
+            _measure(
+                "validate_input_uncached",
+                params,
+                validate_all,
+                setup=response_cache.clear,
+            ),
+            _measure("validate_input_cached", params, validate_all),
+            _measure(
+                "classify_term_uncached",
+                params,
+                classify_all,
+                setup=response_cache.clear,
+            ),
+        ]
+    finally:
+        server.shutdown()
+
+
+def run(quick=False, only=None):
+    """Runs the selected benchmarks in a scratch directory and returns the report."""
+    term_counts = TERM_COUNTS[:2] if quick else TERM_COUNTS
+    history_sizes = HISTORY_SIZES[:2] if quick else HISTORY_SIZES
+    suites = {
+        "verified": lambda: bench_verified_terms(term_counts),
+        "history": lambda: bench_history(history_sizes),
+        "keywords": bench_keywords,
+        "validation": bench_validation,
+    }
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [],
+    }
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        # Data files are resolved relative to the working directory
+        os.chdir(scratch)
+        try:
+            for name, suite in suites.items():
+                if only and only not in name:
+                    continue
+                report["results"].extend(dict(r, suite=name) for r in suite())
+        finally:
+            os.chdir(cwd)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the hot paths.")
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument(
+        "--quick", action="store_true", help="Skip the largest data sizes."
+    )
+    parser.add_argument("--only", help="Run only suites whose name contains this text.")
+    args = parser.parse_args()
+    # Keep the per-call logging of the code under test out of the timings
+    logging.basicConfig(level=logging.ERROR, format="%(levelname)s - %(message)s")
+    logger.setLevel(logging.INFO)
+
+    report = run(quick=args.quick, only=args.only)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
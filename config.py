@@ -78,3 +78,39 @@ HISTORY_GAMES_TO_SHOW = 10
 TIME_LIMIT = 40
 HISTORY_FILE = "game_history.csv"
 VERIFIED_TERMS_FILE = "verified_terms.csv"
+VALIDATION_MAX_WORKERS = 5
+WIKIPEDIA_LANGUAGE = "de"
+RESPONSE_CACHE_FILE = "wikipedia_cache.sqlite3"
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 5000
+RESPONSE_CACHE_TOUCH_INTERVAL = 60 * 60  # seconds between LRU updates of an entry
+REJECTED_TERMS_FILE = "rejected_terms.csv"
+REJECTED_TERM_TTL = 3 * 24 * 60 * 60  # seconds
+VALIDATION_BACKEND = "online"  # "online" or "offline"
+OFFLINE_INDEX_FILE = "dewiki_index.bin"
+STATS_FILE = "game_stats.json"
+STORAGE_BACKEND = "csv"  # "csv" or "sqlite"
+SQLITE_FILE = "city_country_river.sqlite3"
+HISTORY_PAGE_SIZE = 200
+BATCH_VALIDATION_RATE = 2.0  # lookups started per second by validate_many
+BATCH_CHUNK_SIZE = 50  # terms validated between two checkpoints
+BATCH_CHECKPOINT_FILE = "prewarm_checkpoint.csv"
+WIKIPEDIA_API_URL = "https://{language}.wikipedia.org/w/api.php"
+WIKIPEDIA_USER_AGENT = (
+    "CityCountryRiver/1.0 (https://github.com/lefischerander/city-country-river)"
+)
+WIKIPEDIA_RATE_LIMIT = 10.0  # requests per second across all threads
+WIKIPEDIA_RATE_BURST = 5  # requests allowed back to back after an idle period
+WIKIPEDIA_MAX_RETRIES = 3  # retries on HTTP 429/5xx and connection errors
+WIKIPEDIA_BACKOFF = 0.5  # seconds before the first retry, doubled each time
+WIKIPEDIA_TIMEOUT = 10  # seconds per request
+WIKIPEDIA_POOL_SIZE = 10  # keep-alive connections kept by the shared session
+TRACE_LOG_FILE = "trace.jsonl"  # written when tracing is enabled
+HISTORY_CHUNK_SIZE = 5000  # rows held in memory per chunk when streaming the history
+# History files larger than this are queried by streaming instead of being cached
+HISTORY_STREAMING_THRESHOLD = 20 * 1024 * 1024  # bytes
+HISTORY_SCHEMA_VERSION = 1  # bump when synchronize_csv learns a new migration
+HISTORY_META_FILE = "game_history.meta.json"  # schema stamp and migration progress
+TOMBSTONE_COMPACTION_RATIO = 0.25  # deleted share of rows that triggers a rewrite
+VERIFIED_TERMS_DICTIONARY_FILE = "verified_terms.bin"  # read-only, see term_dictionary.py
+VERIFIED_TERMS_EXCLUDED_FILE = "verified_terms_excluded.csv"  # dictionary terms unchecked by the user
@@ -1,40 +1,89 @@
 from datetime import datetime
-import pandas as pd
+from bisect import bisect_left
+from itertools import chain
+import csv
+import hashlib
+import heapq
+import json
 import logging
 import os
-from config import CATEGORIES, HISTORY_FILE, VERIFIED_TERMS_FILE
+import time
+import game_stats
+import history_model
+import sqlite_storage
+import term_dictionary
+import tombstones
+import tracing
+from history_model import HistoryTable
+from config import (
+    CATEGORIES,
+    HISTORY_FILE,
+    HISTORY_META_FILE,
+    HISTORY_SCHEMA_VERSION,
+    HISTORY_STREAMING_THRESHOLD,
+    STATS_FILE,
+    STORAGE_BACKEND,
+    VERIFIED_TERMS_DICTIONARY_FILE,
+    VERIFIED_TERMS_EXCLUDED_FILE,
+    VERIFIED_TERMS_FILE,
+    REJECTED_TERMS_FILE,
+    REJECTED_TERM_TTL,
+    TOMBSTONE_COMPACTION_RATIO,
+)
 
-verified_terms_cache = pd.DataFrame()
+verified_terms_cache = []  # [term, category] rows in file order
+# (category, casefolded term) pairs mirroring verified_terms_cache for O(1) lookups
+verified_terms_index = set()
+# Rows in the verified terms CSV, including ones hidden by tombstones
+_verified_rows_in_file = 0
+_verified_removed_rows = 0
+# Read-only dictionary of pre-validated terms, consulted before the CSV overlay
+verified_dictionary = None
+# (category, casefolded term) pairs of dictionary terms the user unchecked
+excluded_dictionary_terms = set()
+# (category, casefolded term) -> expiry timestamp of terms Wikipedia rejected
+rejected_terms_index = {}
 
 
 # === Module-level utility functions ===
-def _get_letter_from_row(row, categories):
-    """Helper to infer the starting letter from the first valid entry in a row."""
-    for cat in categories:
-        if cat in row and pd.notna(row[cat]) and str(row[cat]).strip():
-            return str(row[cat])[0].upper()
-    return None
+def _infer_letters(table):
+    """Infers each row's starting letter from its first answer, column by column."""
+    letters = [None] * len(table)
+    for cat in CATEGORIES:
+        if cat not in table.columns:
+            continue
+        for i, value in enumerate(table.column(cat)):
+            if letters[i] is None and value is not None and value.strip():
+                letters[i] = value[0].upper()
+    return letters
 
 
-def _synchronize_history_with_config(history_df):
-    """Removes obsolete columns from the history and adjusts points accordingly."""
+def _obsolete_columns(columns):
+    """Returns the history columns that are no longer part of the config."""
     current_valid_columns = ["Date", "Letter"] + CATEGORIES + ["Points"]
-    columns_to_drop = [
-        col for col in history_df.columns if col not in current_valid_columns
-    ]
-    for col in columns_to_drop:
-        mask = history_df[col].notna() & (history_df[col] != "")
-        history_df.loc[mask, "Points"] -= 10
-        history_df.drop(col, axis=1, inplace=True)
-        logging.info(
-            f"Removed obsolete category '{col}' and adjusted points for {mask.sum()} rows."
-        )
-    return history_df
+    return [col for col in columns if col not in current_valid_columns]
 
 
-def _reorder_columns(df):
-    """Ensures column order: 'Date' is first, 'Letter' is second, 'Points' is last, and categories are sorted."""
-    cols = df.columns.tolist()
+def _synchronize_history_with_config(table):
+    """
+    Removes obsolete columns from the history and adjusts points accordingly.
+    Returns the number of adjusted rows per removed column.
+    """
+    adjusted = {}
+    for col in _obsolete_columns(table.columns):
+        answered = [i for i, value in enumerate(table.column(col)) if value is not None]
+        if "Points" in table.columns:
+            points = table.column("Points")
+            for i in answered:
+                points[i] -= 10
+        table.drop_column(col)
+        adjusted[col] = len(answered)
+    return adjusted
+
+
+def _ordered_columns(columns):
+    """Returns column names in file order: 'Date', 'Letter', sorted categories, 'Points'."""
+    cols = list(columns)
     ordered_cols = []
     if "Date" in cols:
         ordered_cols.append("Date")
@@ -45,216 +94,938 @@ def _reorder_columns(df):
     if "Points" in cols:
         cols.remove("Points")
     ordered_cols.extend(sorted(cols))
-    if "Points" in df.columns:
+    if "Points" in columns:
         ordered_cols.append("Points")
-    return df[ordered_cols]
+    return ordered_cols
 
 
-def _read_csv():
-    """Safely reads the history CSV, returning a DataFrame or None."""
-    if not os.path.isfile(HISTORY_FILE):
-        return None
-    try:
-        return pd.read_csv(HISTORY_FILE)
-    except pd.errors.EmptyDataError:
-        logging.info("History CSV is empty.")
-        return None
-    except Exception as e:
-        logging.error(f"Error reading game history from CSV: {e}")
-        return None
+def _read_header(path):
+    """Returns the header row of a CSV file, or an empty list if it has none."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), [])
+
+
+def _ends_with_newline(path):
+    """Checks whether a non-empty file ends with a line break."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        if f.tell() == 0:
+            return True
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) in (b"\n", b"\r")
+
+
+def _append_csv_rows(path, header, rows):
+    """Appends rows to a CSV file, writing the header first if the file is new."""
+    write_header = not os.path.exists(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        start = f.tell()
+        writer = csv.writer(f, lineterminator="\n")
+        if write_header:
+            writer.writerow(header)
+        writer.writerows(rows)
+        tracing.count("storage.bytes_written", f.tell() - start)
 
 
 def _read_and_sort_history():
     """Helper function to read the history CSV and sort it by date."""
-    if not os.path.exists(HISTORY_FILE):
-        return pd.DataFrame()
+    table = history_model.read_history(HISTORY_FILE)
+    if table is None:
+        return HistoryTable()
+    # Most recent first, later rows first within the same day
+    date_keys = table.date_keys()
+    order = sorted(
+        range(len(table)),
+        key=lambda i: _store_sort_key(date_keys[i], table.labels[i]),
+    )
+    return table.take(order)
+
+
+# === History Store ===
+
+
+def _store_sort_key(date_key, label):
+    """Sort key matching the store order: newest date first, missing dates last."""
+    if not date_key:
+        return (1, 0, -label)
+    return (0, -date_key, -label)
+
+
+def _letter_key(letter):
+    """Normalizes a history 'Letter' value for the per-letter index."""
+    return letter.upper() if isinstance(letter, str) else None
+
+
+class HistoryStore:
+    """
+    Keeps the parsed, date-sorted game history in memory between queries.
+    Rows are labelled by their position in the CSV, like a fresh read.
+    """
 
-    df = pd.read_csv(HISTORY_FILE)
-    # Convert 'Date' to datetime objects for correct sorting
-    df["Date"] = pd.to_datetime(df["Date"], format="%d-%m-%Y", errors="coerce")
-    # Sort by date, most recent first
-    df = df.sort_values(by="Date", ascending=False)
-    return df
+    def __init__(self, path):
+        self.path = path
+        self._table = None
+        self._signature = None
+        # Letter -> row labels in the same date-sorted order as the table
+        self._letter_index = {}
+        self._deleted = 0  # Rows of the file that are hidden by tombstones
+
+    def _file_signature(self):
+        """Returns the signature of the history file and its tombstone log."""
+        return game_stats.history_signature(self.path)
+
+    def is_current(self):
+        """Checks whether the loaded table still matches the file on disk."""
+        return self._table is not None and self._file_signature() == self._signature
+
+    def invalidate(self):
+        """Forces a reload on the next query."""
+        self._table = None
+        self._signature = None
+        self._letter_index = {}
+
+    def table(self):
+        """Returns the sorted history, reloading only if the file changed."""
+        if not self.is_current():
+            self._table = _read_and_sort_history()
+            self._deleted = len(history_model.deleted_labels(self.path))
+            self._signature = self._file_signature()
+            self._build_letter_index()
+            logging.debug(f"Loaded {len(self._table)} games into the history store.")
+        return self._table
+
+    def _build_letter_index(self):
+        """Groups the row labels of the loaded table by starting letter."""
+        self._letter_index = {}
+        if self._table.empty or "Letter" not in self._table.columns:
+            return
+        for label, letter in zip(self._table.labels, self._table.column("Letter")):
+            key = _letter_key(letter)
+            if key is not None:
+                self._letter_index.setdefault(key, []).append(label)
+
+    def rows_in_file(self):
+        """Returns the number of rows in the file, including deleted ones."""
+        return len(self._table) + self._deleted
+
+    def _sort_key_of(self, label):
+        """Returns the store sort key of a loaded row."""
+        position = self._table.position_of(label)
+        return _store_sort_key(self._table.date_keys()[position], label)
+
+    def games_by_letter(self, letter):
+        """Returns the games for a letter, in time proportional to the result size."""
+        table = self.table()
+        if table.empty:
+            return table
+        return table.take_labels(self._letter_index.get(letter.upper(), []))
+
+    def apply_append(self, data):
+        """Adds a row that was just appended to the file."""
+        table = self._table
+        label = self.rows_in_file()
+        new_key = _store_sort_key(history_model.date_ordinal(data.get("Date")), label)
+        date_keys = table.date_keys()
+        position = bisect_left(
+            range(len(table)),
+            new_key,
+            key=lambda i: _store_sort_key(date_keys[i], table.labels[i]),
+        )
+
+        key = _letter_key(data.get("Letter"))
+        if key is not None:
+            labels = self._letter_index.setdefault(key, [])
+            insert_at = bisect_left(labels, new_key, key=self._sort_key_of)
+            labels.insert(insert_at, label)
+
+        table.insert(position, data, label)
+        self._signature = self._file_signature()
+
+    def apply_delete(self, index_to_delete):
+        """Drops a row that was just marked as deleted; other labels stay the same."""
+        table = self._table
+        position = table.position_of(index_to_delete)
+        key = _letter_key(table.row(position).get("Letter"))
+        if key is not None:
+            self._letter_index[key].remove(index_to_delete)
+        table.delete(position)
+        self._deleted += 1
+        self._signature = self._file_signature()
+
+
+history_store = HistoryStore(HISTORY_FILE)
+
+
+# === Streaming Queries ===
+
+
+def _use_streaming():
+    """
+    Checks whether a query should stream the history file instead of loading it
+    into the history store, which holds every row in memory.
+    """
+    if history_store.is_current():
+        return False
+    try:
+        return os.path.getsize(HISTORY_FILE) > HISTORY_STREAMING_THRESHOLD
+    except OSError:
+        return False
+
+
+def _table_from_rows(columns, rows):
+    """Builds a table from (label, row dict) pairs."""
+    table = HistoryTable(columns)
+    for label, row in rows:
+        table.append(row, label)
+    return table
+
+
+def _stream_last_games(n):
+    """Returns the n most recent games, holding at most 2n rows in memory."""
+    newest = []  # (sort key, label, row) of the most recent rows seen so far
+    for chunk in history_model.iter_history(HISTORY_FILE):
+        date_keys = chunk.date_keys()
+        keyed = (
+            (_store_sort_key(date_keys[i], label), i)
+            for i, label in enumerate(chunk.labels)
+        )
+        candidates = [
+            (key, chunk.labels[i], chunk.row(i)) for key, i in heapq.nsmallest(n, keyed)
+        ]
+        newest = heapq.nsmallest(n, newest + candidates, key=lambda item: item[0])
+    return _table_from_rows(
+        _read_header(HISTORY_FILE), [(label, row) for _, label, row in newest]
+    )
+
+
+def _stream_games_by_letter(letter):
+    """Returns the games for a letter, holding only the matching rows in memory."""
+    key = letter.upper()
+    matches = []
+    for chunk in history_model.iter_history(HISTORY_FILE):
+        if "Letter" not in chunk.columns:
+            break
+        for i, value in enumerate(chunk.column("Letter")):
+            if _letter_key(value) == key:
+                matches.append((chunk.labels[i], chunk.row(i)))
+    matches.sort(
+        key=lambda match: _store_sort_key(
+            history_model.date_ordinal(match[1].get("Date")), match[0]
+        )
+    )
+    return _table_from_rows(_read_header(HISTORY_FILE), matches)
+
+
+# === Statistics ===
+
+# Aggregates for the history file with signature _game_stats_signature
+_game_stats = None
+_game_stats_signature = None
+
+
+def _stats_before_write():
+    """Returns aggregates matching the history file as it is now, or None."""
+    if (
+        _game_stats is not None
+        and _game_stats_signature == game_stats.history_signature(HISTORY_FILE)
+    ):
+        return _game_stats
+    return game_stats.load_sidecar(STATS_FILE, HISTORY_FILE, CATEGORIES)
+
+
+def _stats_after_write(stats, added=None, removed=None):
+    """Applies one saved or deleted game to the aggregates and persists them."""
+    global _game_stats, _game_stats_signature
+    if stats is None:
+        # The aggregates were already stale; rebuild them on the next request.
+        _game_stats = None
+        return
+    if added is not None:
+        stats.add_game(added)
+    if removed is not None:
+        stats.remove_game(removed)
+    _game_stats = stats
+    _game_stats_signature = game_stats.history_signature(HISTORY_FILE)
+    game_stats.save_sidecar(stats, STATS_FILE, HISTORY_FILE)
+
+
+@tracing.traced("data_manager.get_game_stats")
+def get_game_stats():
+    """Returns the running game statistics, scanning the history only if needed."""
+    global _game_stats, _game_stats_signature
+    if STORAGE_BACKEND == "sqlite":
+        return game_stats.GameStats.from_dict(
+            sqlite_storage.get_game_aggregates(CATEGORIES)
+        )
+
+    signature = game_stats.history_signature(HISTORY_FILE)
+    if _game_stats is not None and _game_stats_signature == signature:
+        return _game_stats
+
+    stats = game_stats.load_sidecar(STATS_FILE, HISTORY_FILE, CATEGORIES)
+    if stats is None:
+        logging.info("Rebuilding game statistics from the history file...")
+        try:
+            stats = game_stats.GameStats.from_records(
+                (row for _, row in history_model.iter_records(HISTORY_FILE)),
+                CATEGORIES,
+            )
+        except Exception as e:
+            logging.error(f"Error reading game history from CSV: {e}")
+            stats = game_stats.GameStats(CATEGORIES)
+        game_stats.save_sidecar(stats, STATS_FILE, HISTORY_FILE)
+    _game_stats = stats
+    _game_stats_signature = signature
+    return stats
 
 
 # === Data Manager ===
 
 
+def _term_key(term, category):
+    """Builds the lookup key used by the verified terms index."""
+    return (category, str(term).casefold())
+
+
+def _write_verified_terms():
+    """Rewrites the verified terms CSV from the in-memory cache."""
+    temp_path = f"{VERIFIED_TERMS_FILE}.tmp"
+    with open(temp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["Term", "Category"])
+        writer.writerows(verified_terms_cache)
+    os.replace(temp_path, VERIFIED_TERMS_FILE)
+    tombstones.clear(VERIFIED_TERMS_FILE)
+
+
+def _load_verified_dictionary():
+    """Opens the verified terms dictionary, if any, and the user's exclusions."""
+    global verified_dictionary, excluded_dictionary_terms
+    if verified_dictionary is not None:
+        verified_dictionary.close()
+    try:
+        verified_dictionary = term_dictionary.open_dictionary(
+            VERIFIED_TERMS_DICTIONARY_FILE
+        )
+    except (OSError, ValueError) as e:
+        logging.error(f"Error opening the verified terms dictionary: {e}")
+        verified_dictionary = None
+
+    excluded_dictionary_terms = set()
+    if os.path.exists(VERIFIED_TERMS_EXCLUDED_FILE):
+        with open(VERIFIED_TERMS_EXCLUDED_FILE, newline="", encoding="utf-8") as f:
+            excluded_dictionary_terms = {
+                _term_key(row["Term"], row["Category"]) for row in csv.DictReader(f)
+            }
+
+
+def _in_dictionary(key):
+    """Checks a verified terms key against the dictionary, minus exclusions."""
+    return (
+        verified_dictionary is not None
+        and key not in excluded_dictionary_terms
+        and verified_dictionary.contains(key[1], key[0])
+    )
+
+
+@tracing.traced("data_manager.load_verified_terms")
 def load_verified_terms():
-    """Loads the verified terms from CSV into an in-memory DataFrame cache."""
-    global verified_terms_cache
+    """
+    Opens the verified terms dictionary and loads the verified terms CSV, which
+    overlays it, into an in-memory cache.
+    """
+    global verified_terms_cache, verified_terms_index
+    global _verified_rows_in_file, _verified_removed_rows
+    _load_verified_dictionary()
+    if STORAGE_BACKEND == "sqlite":
+        count = sqlite_storage.count_verified_terms()
+        logging.info(f"Using {count} verified terms from the SQLite backend.")
+        return
     if os.path.exists(VERIFIED_TERMS_FILE):
-        verified_terms_cache = pd.read_csv(VERIFIED_TERMS_FILE)
+        tracing.count("storage.bytes_read", os.path.getsize(VERIFIED_TERMS_FILE))
+        with open(VERIFIED_TERMS_FILE, newline="", encoding="utf-8") as f:
+            rows = [[row["Term"], row["Category"]] for row in csv.DictReader(f)]
+        verified_terms_cache = tombstones.live_rows(
+            VERIFIED_TERMS_FILE, rows, key=lambda row: _term_key(row[0], row[1])
+        )
+        _verified_rows_in_file = len(rows)
+        _verified_removed_rows = len(rows) - len(verified_terms_cache)
         logging.info(f"Loaded {len(verified_terms_cache)} verified terms.")
     else:
         logging.info(
             f"'{VERIFIED_TERMS_FILE}' not found. Starting with an empty cache."
         )
-        verified_terms_cache = pd.DataFrame(columns=["Term", "Category"])
+        verified_terms_cache = []
+        _verified_rows_in_file = _verified_removed_rows = 0
+    verified_terms_index = {
+        _term_key(term, category) for term, category in verified_terms_cache
+    }
 
 
 def is_term_verified(term, category):
-    """Checks if a term/category pair exists in the local cache."""
-    if verified_terms_cache.empty:
-        return False
-
-    # Case-insensitive check
-    match = verified_terms_cache[
-        (verified_terms_cache["Term"].str.lower() == term.lower())
-        & (verified_terms_cache["Category"] == category)
-    ]
-    return not match.empty
+    """Checks if a term/category pair is in the dictionary or the local cache."""
+    # Case-insensitive check, read-only dictionary first
+    key = _term_key(term, category)
+    if _in_dictionary(key):
+        return True
+    if STORAGE_BACKEND == "sqlite":
+        return sqlite_storage.is_term_verified(term, category)
+    return key in verified_terms_index
 
 
+@tracing.traced("data_manager.add_verified_term")
 def add_verified_term(term, category):
     """Adds a newly verified term to the CSV and the in-memory cache."""
-    global verified_terms_cache
+    global _verified_rows_in_file
+    if STORAGE_BACKEND == "sqlite":
+        sqlite_storage.add_verified_term(term, category)
+        return
 
     # Add to the CSV
-    new_entry = pd.DataFrame([{"Term": term, "Category": category}])
-    new_entry.to_csv(
-        VERIFIED_TERMS_FILE,
-        mode="a",
-        header=not os.path.exists(VERIFIED_TERMS_FILE),
-        index=False,
-    )
+    _append_csv_rows(VERIFIED_TERMS_FILE, ["Term", "Category"], [[term, category]])
+    _verified_rows_in_file += 1
 
     # Add to the in-memory cache to avoid reloading
-    verified_terms_cache = pd.concat(
-        [verified_terms_cache, new_entry], ignore_index=True
-    )
+    verified_terms_cache.append([term, category])
+    verified_terms_index.add(_term_key(term, category))
     logging.info(f"Cached '{term}' for category '{category}'.")
 
 
+@tracing.traced("data_manager.add_verified_terms")
+def add_verified_terms(pairs):
+    """
+    Adds many verified (term, category) pairs with a single append.
+    Pairs that are already cached are skipped. Returns the number added.
+    """
+    global _verified_rows_in_file
+    pairs = [pair for pair in pairs if not _in_dictionary(_term_key(*pair))]
+    if STORAGE_BACKEND == "sqlite":
+        return sqlite_storage.add_verified_terms(pairs)
+
+    new_rows = []
+    for term, category in pairs:
+        key = _term_key(term, category)
+        if key not in verified_terms_index:
+            verified_terms_index.add(key)
+            new_rows.append([term, category])
+    if not new_rows:
+        return 0
+
+    _append_csv_rows(VERIFIED_TERMS_FILE, ["Term", "Category"], new_rows)
+    _verified_rows_in_file += len(new_rows)
+    verified_terms_cache.extend(new_rows)
+    logging.info(f"Cached {len(new_rows)} verified terms.")
+    return len(new_rows)
+
+
+@tracing.traced("data_manager.remove_verified_term")
 def remove_verified_term(term, category):
-    """Removes a term/category pair from the CSV and the in-memory cache."""
-    global verified_terms_cache
-    if verified_terms_cache.empty:
+    """
+    Removes a term/category pair from the in-memory cache and records a
+    tombstone for it. The CSV is only rewritten once enough rows are removed.
+    """
+    global verified_terms_cache, _verified_removed_rows
+    key = _term_key(term, category)
+    if _in_dictionary(key):
+        # The dictionary is read-only, so record the user's verdict next to it
+        _append_csv_rows(
+            VERIFIED_TERMS_EXCLUDED_FILE, ["Term", "Category"], [[key[1], category]]
+        )
+        excluded_dictionary_terms.add(key)
+        logging.info(f"Excluded '{term}' for category '{category}' from dictionary.")
+    if STORAGE_BACKEND == "sqlite":
+        sqlite_storage.remove_verified_term(term, category)
+        return
+    if key not in verified_terms_index:
         return
 
-    # Find the index of the row to remove (case-insensitive)
-    initial_rows = len(verified_terms_cache)
-    indices_to_drop = verified_terms_cache[
-        (verified_terms_cache["Term"].str.lower() == term.lower())
-        & (verified_terms_cache["Category"] == category)
-    ].index
+    # Hide every case variant written so far; a later re-add stays visible
+    tombstones.append(VERIFIED_TERMS_FILE, [*key, _verified_rows_in_file])
+    cached = len(verified_terms_cache)
+    verified_terms_cache = [
+        row for row in verified_terms_cache if _term_key(row[0], row[1]) != key
+    ]
+    verified_terms_index.discard(key)
+    _verified_removed_rows += cached - len(verified_terms_cache)
+    logging.info(f"Removed '{term}' for category '{category}' from cache.")
+    if _verified_removed_rows > TOMBSTONE_COMPACTION_RATIO * _verified_rows_in_file:
+        _compact_verified_terms()
+
+
+def _write_rejected_terms():
+    """Rewrites the rejected terms CSV from the in-memory index."""
+    temp_path = f"{REJECTED_TERMS_FILE}.tmp"
+    with open(temp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(["Term", "Category", "Expires"])
+        for (category, term), expires in rejected_terms_index.items():
+            writer.writerow([term, category, expires])
+    os.replace(temp_path, REJECTED_TERMS_FILE)
 
-    if not indices_to_drop.empty:
-        # Remove from the in-memory cache
-        verified_terms_cache = verified_terms_cache.drop(indices_to_drop)
 
-        # If something was actually dropped, rewrite the CSV file
-        if len(verified_terms_cache) < initial_rows:
-            verified_terms_cache.to_csv(VERIFIED_TERMS_FILE, index=False)
-            logging.info(f"Removed '{term}' for category '{category}' from cache.")
+@tracing.traced("data_manager.load_rejected_terms")
+def load_rejected_terms():
+    """Loads the unexpired rejected terms from CSV into the in-memory index."""
+    global rejected_terms_index
+    rejected_terms_index = {}
+    if not os.path.exists(REJECTED_TERMS_FILE):
+        logging.info(
+            f"'{REJECTED_TERMS_FILE}' not found. Starting with an empty negative cache."
+        )
+        return
 
+    tracing.count("storage.bytes_read", os.path.getsize(REJECTED_TERMS_FILE))
+    with open(REJECTED_TERMS_FILE, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    now = time.time()
+    for row in rows:
+        expires = float(row["Expires"])
+        if expires > now:
+            rejected_terms_index[_term_key(row["Term"], row["Category"])] = expires
 
+    # Drop expired entries from disk so the file does not grow without bound
+    if len(rejected_terms_index) < len(rows):
+        _write_rejected_terms()
+    logging.info(f"Loaded {len(rejected_terms_index)} rejected terms.")
+
+
+def is_term_rejected(term, category):
+    """Checks if a term/category pair was recently rejected by the validator."""
+    expires = rejected_terms_index.get(_term_key(term, category))
+    if expires is None:
+        return False
+    if expires <= time.time():
+        del rejected_terms_index[_term_key(term, category)]
+        return False
+    return True
+
+
+@tracing.traced("data_manager.add_rejected_term")
+def add_rejected_term(term, category):
+    """Records a rejected term in the CSV and the in-memory negative cache."""
+    key = _term_key(term, category)
+    expires = time.time() + REJECTED_TERM_TTL
+    _append_csv_rows(
+        REJECTED_TERMS_FILE,
+        ["Term", "Category", "Expires"],
+        [[key[1], category, expires]],
+    )
+    rejected_terms_index[key] = expires
+    logging.info(f"Marked '{term}' as rejected for category '{category}'.")
+
+
+@tracing.traced("data_manager.add_rejected_terms")
+def add_rejected_terms(pairs):
+    """Records many rejected (term, category) pairs with a single append."""
+    expires = time.time() + REJECTED_TERM_TTL
+    keys = [_term_key(term, category) for term, category in pairs]
+    if not keys:
+        return
+    _append_csv_rows(
+        REJECTED_TERMS_FILE,
+        ["Term", "Category", "Expires"],
+        [[term, category, expires] for category, term in keys],
+    )
+    for key in keys:
+        rejected_terms_index[key] = expires
+    logging.info(f"Marked {len(keys)} terms as rejected.")
+
+
+@tracing.traced("data_manager.remove_rejected_term")
+def remove_rejected_term(term, category):
+    """Invalidates a rejected term, e.g. after the user overrides the verdict."""
+    if rejected_terms_index.pop(_term_key(term, category), None) is None:
+        return
+    _write_rejected_terms()
+    logging.info(f"Removed '{term}' for category '{category}' from negative cache.")
+
+
+def _find_game(label, use_store):
+    """
+    Returns the row of a game (None if there is no such game) and the number of
+    games in the history, from the history store or a streaming pass.
+    """
+    if use_store:
+        table = history_store.table()
+        position = table.position_of(label)
+        return (None if position is None else table.row(position)), len(table)
+    found = None
+    live_rows = 0
+    for chunk in history_model.iter_history(HISTORY_FILE):
+        live_rows += len(chunk)
+        position = chunk.position_of(label)
+        if position is not None:
+            found = chunk.row(position)
+    return found, live_rows
+
+
+@tracing.traced("data_manager.delete_game_by_index")
 def delete_game_by_index(index_to_delete):
-    """Deletes a game record from the history CSV by its DataFrame index."""
+    """Deletes a game record from the history CSV by its row position."""
+    if STORAGE_BACKEND == "sqlite":
+        if sqlite_storage.delete_game(index_to_delete):
+            logging.info(f"Deleted game record with id {index_to_delete}.")
+        else:
+            logging.warning(
+                f"Attempted to delete non-existent game id {index_to_delete}."
+            )
+        return
+
     if not os.path.exists(HISTORY_FILE):
         logging.warning("Attempted to delete from a non-existent history file.")
         return
 
-    df = pd.read_csv(HISTORY_FILE)
-    if index_to_delete in df.index:
-        df = df.drop(index_to_delete)
-        # Save the updated dataframe back to the CSV, overwriting the old file.
-        df.to_csv(HISTORY_FILE, index=False)
-        logging.info(f"Deleted game record at index {index_to_delete}.")
-    else:
+    store_was_current = history_store.is_current()
+    schema_was_current = _schema_is_current()
+    stats = _stats_before_write()
+    try:
+        deleted_row, live_rows = _find_game(index_to_delete, store_was_current)
+    except ValueError as e:
+        logging.error(f"Error reading game history from CSV: {e}")
+        return
+    if deleted_row is None:
         logging.warning(
             f"Attempted to delete non-existent index {index_to_delete} from history."
         )
+        return
+
+    # Record the delete in the tombstone log instead of rewriting the file
+    history_model.delete_label(HISTORY_FILE, index_to_delete)
+    if schema_was_current:
+        _save_schema_stamp()
+    _stats_after_write(stats, removed=deleted_row)
+    if store_was_current:
+        history_store.apply_delete(index_to_delete)
+    else:
+        history_store.invalidate()
+    logging.info(f"Deleted game record at index {index_to_delete}.")
 
+    deleted = len(history_model.deleted_labels(HISTORY_FILE))
+    if deleted > TOMBSTONE_COMPACTION_RATIO * (live_rows - 1 + deleted):
+        _compact_history()
 
+
+@tracing.traced("data_manager.get_all_games")
 def get_all_games():
-    """Returns all game results from the CSV file, sorted by most recent."""
-    return _read_and_sort_history()
+    """Returns all game results from the history store, sorted by most recent."""
+    if STORAGE_BACKEND == "sqlite":
+        return sqlite_storage.get_all_games()
+    return history_store.table().copy()
 
 
+@tracing.traced("data_manager.get_last_games")
 def get_last_games(n):
-    """Returns the last n game results from the CSV file, sorted by most recent."""
-    df = _read_and_sort_history()
-    return df.head(n)
+    """Returns the last n game results from the history store, sorted by most recent."""
+    if STORAGE_BACKEND == "sqlite":
+        return sqlite_storage.get_last_games(n)
+    if _use_streaming():
+        return _stream_last_games(n)
+    return history_store.table().head(n)
 
 
+@tracing.traced("data_manager.get_games_by_letter")
 def get_games_by_letter(letter):
     """Returns all games for a specific letter, sorted by most recent."""
-    df = _read_and_sort_history()
-    # Filter after sorting
-    return df[df["Letter"].str.upper() == letter.upper()]
+    if STORAGE_BACKEND == "sqlite":
+        return sqlite_storage.get_games_by_letter(letter)
+    if _use_streaming():
+        return _stream_games_by_letter(letter)
+    return history_store.games_by_letter(letter)
 
 
 def get_letter_distribution():
-    """Calculates the frequency of each starting letter from the game history."""
-    df = _read_and_sort_history()
-    if df.empty:
-        return pd.Series(dtype=int)
-    # Count occurrences and sort alphabetically for a clean chart
-    return df["Letter"].value_counts().sort_index()
+    """Returns the frequency of each starting letter, sorted alphabetically."""
+    return get_game_stats().letter_distribution()
 
 
+@tracing.traced("data_manager.save_results_to_csv")
 def save_results_to_csv(data):
     """Appends round results to the CSV, handling all synchronization and formatting."""
+    if STORAGE_BACKEND == "sqlite":
+        try:
+            sqlite_storage.save_game(data)
+            logging.info("Saved results to the SQLite backend.")
+        except Exception as e:
+            logging.error(f"Error saving to SQLite: {e}")
+        return
+
     try:
-        round_df = pd.DataFrame([data])
+        stats = _stats_before_write()
         if not os.path.isfile(HISTORY_FILE):
-            round_df.to_csv(HISTORY_FILE, index=False)
+            history_model.append_row(HISTORY_FILE, list(data), data, write_header=True)
+            history_store.invalidate()
+            _stats_after_write(stats, added=data)
             logging.info(f"Created and saved results to {HISTORY_FILE}")
+            return
+
+        header = _read_header(HISTORY_FILE)
+        if header and set(data) <= set(header) and _ordered_columns(header) == header:
+            # Fast path: the layout is unchanged, so only the new row is written
+            store_was_current = history_store.is_current()
+            schema_was_current = _schema_is_current()
+            if not _ends_with_newline(HISTORY_FILE):
+                with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+                    f.write("\n")
+            history_model.append_row(HISTORY_FILE, header, data)
+            if schema_was_current:
+                # A row saved by the game matches the schema the file is in
+                _save_schema_stamp()
+            if store_was_current:
+                history_store.apply_append(data)
+            else:
+                history_store.invalidate()
+            _stats_after_write(stats, added=data)
+            logging.info(f"Appended results to {HISTORY_FILE}")
         else:
-            history_df = pd.read_csv(HISTORY_FILE)
-            combined_df = pd.concat([history_df, round_df], ignore_index=True)
-            final_df = _reorder_columns(combined_df)
-            final_df.to_csv(HISTORY_FILE, index=False)
-            logging.info(f"Appended results and updated {HISTORY_FILE}")
+            columns = header + [column for column in data if column not in header]
+            new_row = HistoryTable(columns)
+            new_row.append(data)
+            history_model.write_history_chunks(
+                _ordered_columns(columns),
+                chain(history_model.iter_history(HISTORY_FILE), [new_row]),
+                HISTORY_FILE,
+            )
+            history_store.invalidate()
+            _stats_after_write(stats, added=data)
+            logging.info(f"Rewrote {HISTORY_FILE} with an updated column layout")
     except Exception as e:
         logging.error(f"Error saving to CSV: {e}")
 
 
-def _ensure_date_column(df):
-    """Adds and fills the 'Date' column if it's missing or has nulls."""
-    if "Date" not in df.columns:
-        logging.info("Migrating data: 'Date' column not found. Adding column.")
-        df["Date"] = None
+def _ensure_date_column(table, today):
+    """
+    Adds the 'Date' column if it's missing and fills missing dates with today.
+    Returns the number of filled rows.
+    """
+    if "Date" not in table.columns:
+        table.add_column("Date")
+    dates = table.column("Date")
+    missing = dates.count(None)
+    if missing:
+        dates[:] = [today if date is None else date for date in dates]
+    return missing
 
-    if df["Date"].isnull().any():
-        logging.info("Found rows with missing dates. Assigning today's date.")
-        today_date_str = datetime.now().strftime("%d-%m-%Y")
-        df["Date"] = df["Date"].fillna(today_date_str)
-    return df
 
-
-def _ensure_letter_column(df):
+def _ensure_letter_column(table):
     """Adds and infers the 'Letter' column if it's missing."""
-    if "Letter" not in df.columns:
-        logging.info("Migrating data: 'Letter' column not found. Inferring letters...")
-        letters = df.apply(_get_letter_from_row, axis=1, categories=CATEGORIES)
-        df.insert(0, "Letter", letters)
-    return df
+    if "Letter" in table.columns:
+        return
+    letters = _infer_letters(table)
+    table.add_column("Letter")
+    table.column("Letter")[:] = letters
+
+
+def _has_missing_dates():
+    """Checks whether any history row lacks a date, one chunk at a time."""
+    return any(
+        None in chunk.column("Date")
+        for chunk in history_model.iter_history(HISTORY_FILE)
+    )
+
+
+# === Schema Stamp ===
+
+
+def _schema_fingerprint():
+    """Fingerprints the schema version and the config the history layout follows."""
+    layout = [HISTORY_SCHEMA_VERSION, history_model.DATE_FORMAT, CATEGORIES]
+    return hashlib.sha256(json.dumps(layout).encode("utf-8")).hexdigest()[:16]
+
+
+def _load_schema_stamp():
+    """Returns the contents of the schema sidecar, or {} if it is missing."""
+    if not os.path.exists(HISTORY_META_FILE):
+        return {}
+    try:
+        with open(HISTORY_META_FILE, encoding="utf-8") as f:
+            stamp = json.load(f)
+        return stamp if isinstance(stamp, dict) else {}
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable schema file '{HISTORY_META_FILE}': {e}")
+        return {}
+
+
+def _save_schema_stamp(migration=None):
+    """
+    Records that the history file, as it is now, matches the current schema.
+    With a migration, records its progress instead.
+    """
+    stamp = {
+        "schema_version": HISTORY_SCHEMA_VERSION,
+        "fingerprint": _schema_fingerprint(),
+        "source": None if migration else game_stats.history_signature(HISTORY_FILE),
+    }
+    if migration:
+        stamp["migration"] = migration
+    temp_path = f"{HISTORY_META_FILE}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+        os.replace(temp_path, HISTORY_META_FILE)
+    except OSError as e:
+        logging.error(f"Error saving schema file '{HISTORY_META_FILE}': {e}")
+
+
+def _schema_is_current(stamp=None):
+    """Checks whether the stamp vouches for the history file as it is now."""
+    if stamp is None:
+        stamp = _load_schema_stamp()
+    return (
+        "migration" not in stamp
+        and stamp.get("schema_version") == HISTORY_SCHEMA_VERSION
+        and stamp.get("fingerprint") == _schema_fingerprint()
+        and stamp.get("source") is not None
+        and stamp.get("source") == game_stats.history_signature(HISTORY_FILE)
+    )
+
+
+def _migrate_history(header, stamp):
+    """
+    Rewrites the history to match the current config, one chunk at a time.
+    Progress is checkpointed in the schema sidecar after every chunk, so an
+    interrupted migration continues where it stopped on the next start.
+    """
+    obsolete = _obsolete_columns(header)
+    columns = [col for col in header if col not in obsolete]
+    columns += [col for col in ("Date", "Letter") if col not in columns]
+    columns = _ordered_columns(columns)
+    temp_path = f"{HISTORY_FILE}.migrating"
+    source = game_stats.history_signature(HISTORY_FILE)
+
+    progress = stamp.get("migration")
+    resumable = (
+        progress is not None
+        and stamp.get("fingerprint") == _schema_fingerprint()
+        and progress.get("source") == source
+        and os.path.exists(temp_path)
+        and os.path.getsize(temp_path) >= progress.get("bytes", 0) > 0
+    )
+    if resumable:
+        logging.info(f"Resuming interrupted migration after {progress['rows']} rows.")
+        with open(temp_path, "r+b") as f:
+            f.truncate(progress["bytes"])
+    else:
+        if "Date" not in header:
+            logging.info("Migrating data: 'Date' column not found. Adding column.")
+        if "Letter" not in header:
+            logging.info(
+                "Migrating data: 'Letter' column not found. Inferring letters..."
+            )
+        progress = {
+            "source": source,
+            "rows": 0,
+            "bytes": 0,
+            "today": datetime.now().strftime(history_model.DATE_FORMAT),
+            "filled_dates": 0,
+            "adjusted": dict.fromkeys(obsolete, 0),
+        }
+
+    with open(temp_path, "a" if resumable else "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if not resumable:
+            writer.writerow(columns)
+        for chunk in history_model.iter_history(HISTORY_FILE, skip=progress["rows"]):
+            progress["filled_dates"] += _ensure_date_column(chunk, progress["today"])
+            _ensure_letter_column(chunk)
+            for col, count in _synchronize_history_with_config(chunk).items():
+                progress["adjusted"][col] += count
+            history_model.write_table_rows(writer, columns, chunk)
+            f.flush()
+            os.fsync(f.fileno())
+            progress["rows"] = chunk.labels[-1] + 1
+            progress["bytes"] = f.tell()
+            _save_schema_stamp(migration=progress)
+    os.replace(temp_path, HISTORY_FILE)
+    # Deleted rows were left out of the migrated file
+    tombstones.clear(HISTORY_FILE)
+    _save_schema_stamp()
 
+    if progress["filled_dates"]:
+        logging.info(
+            f"Found {progress['filled_dates']} rows with missing dates. "
+            "Assigned today's date."
+        )
+    for col, count in progress["adjusted"].items():
+        logging.info(
+            f"Removed obsolete category '{col}' and adjusted points for {count} rows."
+        )
 
+
+@tracing.traced("data_manager.synchronize_csv")
 def synchronize_csv():
-    """Checks and updates the CSV on app start to match the current config."""
+    """
+    Checks and updates the CSV on app start to match the current config.
+    A schema stamp stored next to the history lets unchanged files skip the scan;
+    migrations stream the file in chunks and can resume after an interruption.
+    """
+    if STORAGE_BACKEND == "sqlite":
+        sqlite_storage.synchronize_with_config()
+        return
+
     if not os.path.isfile(HISTORY_FILE):
         logging.info("CSV file not found. Nothing to synchronize.")
         return
     try:
-        history_df = pd.read_csv(HISTORY_FILE)
-        if history_df.empty:
+        stamp = _load_schema_stamp()
+        if _schema_is_current(stamp):
+            logging.debug("History matches the current schema. Skipping the scan.")
             return
 
-        original_df = history_df.copy()
+        header = _read_header(HISTORY_FILE)
+        if "Date" in header and "Letter" in header and not _obsolete_columns(header):
+            if not _has_missing_dates():
+                _save_schema_stamp()
+                return
 
-        # Perform synchronization steps
-        history_df = _ensure_date_column(history_df)
-        history_df = _ensure_letter_column(history_df)
-        history_df = _synchronize_history_with_config(history_df)
+        # A header without rows is left as it is
+        if next(history_model.iter_history(HISTORY_FILE, chunk_size=1), None) is None:
+            return
 
-        # Check if any changes were made by comparing DataFrames
-        if not original_df.equals(history_df):
-            final_df = _reorder_columns(history_df)
-            final_df.to_csv(HISTORY_FILE, index=False)
-            logging.info("Successfully synchronized and saved CSV with current rules.")
+        _migrate_history(header, stamp)
+        logging.info("Successfully synchronized and saved CSV with current rules.")
 
     except Exception as e:
         logging.error(f"Failed to synchronize CSV on startup: {e}")
+
+
+# === Compaction ===
+
+
+def _compact_history():
+    """Rewrites the history without its deleted rows and drops the tombstone log."""
+    schema_was_current = _schema_is_current()
+    stats = _stats_before_write()
+    history_model.write_history_chunks(
+        _read_header(HISTORY_FILE),
+        history_model.iter_history(HISTORY_FILE),
+        HISTORY_FILE,
+    )
+    # Rows after the deleted ones moved up, so their labels changed
+    history_store.invalidate()
+    if schema_was_current:
+        _save_schema_stamp()
+    _stats_after_write(stats)
+    logging.info(f"Compacted {HISTORY_FILE}.")
+
+
+def _compact_verified_terms():
+    """Rewrites the verified terms CSV without its removed rows."""
+    global _verified_rows_in_file, _verified_removed_rows
+    _write_verified_terms()
+    _verified_rows_in_file = len(verified_terms_cache)
+    _verified_removed_rows = 0
+    logging.info(f"Compacted {VERIFIED_TERMS_FILE}.")
+
+
+@tracing.traced("data_manager.compact_storage")
+def compact_storage():
+    """Applies all pending tombstones to the CSV files, e.g. when the app exits."""
+    if STORAGE_BACKEND == "sqlite":
+        return
+    try:
+        if history_model.deleted_labels(HISTORY_FILE):
+            _compact_history()
+        if _verified_removed_rows:
+            _compact_verified_terms()
+    except Exception as e:
+        logging.error(f"Failed to compact the CSV files: {e}")
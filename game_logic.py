@@ -1,9 +1,12 @@
 import random
-from wikipedia_scraper import validate_input
+from wikipedia_scraper import classify_term, submit_in_round, validation_round
 import logging
-from config import CATEGORIES
+from config import CATEGORIES, VALIDATION_MAX_WORKERS
 import data_manager
+import tracing
 from datetime import datetime
+from history_model import DATE_FORMAT
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # === Module-level utility functions ===
@@ -13,6 +16,18 @@ def get_letter():
     return random.choice(common_letters)
 
 
+def _verdict_result(term, is_valid):
+    """
+    Builds the result of a validated answer. An answer whose lookup failed
+    (is_valid is None) scores no points and is flagged for the review, where
+    the player can still accept it.
+    """
+    result = {"term": term, "points": 10 if is_valid else 0}
+    if is_valid is None:
+        result["unverified"] = True
+    return result
+
+
 # === Game Class ===
 class Game:
     """Represents a single round of the game."""
@@ -23,40 +38,96 @@ class Game:
         self.initial_results = {}
         self.final_results = {}
         self.points = 0
+        self.trace_id = tracing.new_round_id()
 
-    def validate_answers(self, inputs):
+    def validate_answers(self, inputs, on_result=None):
         """
         Performs initial validation of user inputs using a cache-first approach.
+        Uncached terms are looked up on Wikipedia concurrently.
+        :param on_result: Optional function called with (category, result) as soon
+            as each verdict is known. It may be called from worker threads.
         """
-        logging.info(
-            f"Performing initial validation for game with letter '{self.letter}'..."
-        )
-        self.initial_results = {}
-
-        for category, term in inputs.items():
-            points = 0
-            clean_term = term.strip() if term else ""
-
-            # If the term isn't empty, check its validity
-            if (
-                clean_term
-                and clean_term.upper().startswith(self.letter)
-                and len(clean_term) > 1
-            ):
-                # Check the local cache first
-                if data_manager.is_term_verified(clean_term, category):
-                    logging.info(
-                        f"Found '{clean_term}' in cache for category '{category}'."
+        with tracing.round_scope(self.trace_id, "validate"), tracing.span(
+            "game.validate_answers", letter=self.letter
+        ):
+            logging.info(
+                f"Performing initial validation for game with letter '{self.letter}'..."
+            )
+            self.initial_results = {}
+            pending = {}
+
+            for category, term in inputs.items():
+                points = 0
+                clean_term = term.strip() if term else ""
+
+                # If the term isn't empty, check its validity
+                if (
+                    clean_term
+                    and clean_term.upper().startswith(self.letter)
+                    and len(clean_term) > 1
+                ):
+                    # Check the local cache first
+                    if data_manager.is_term_verified(clean_term, category):
+                        tracing.count("term_cache.hit")
+                        logging.info(
+                            f"Found '{clean_term}' in cache for category '{category}'."
+                        )
+                        points = 10
+                    # Skip terms the validator rejected recently
+                    elif data_manager.is_term_rejected(clean_term, category):
+                        tracing.count("term_cache.hit")
+                        logging.info(
+                            f"Found '{clean_term}' in negative cache for category '{category}'."
+                        )
+                    # If not in either cache, queue it for the Wikipedia validator
+                    else:
+                        tracing.count("term_cache.miss")
+                        pending[category] = clean_term
+
+                self.initial_results[category] = {"term": clean_term, "points": points}
+                if on_result and category not in pending:
+                    on_result(category, dict(self.initial_results[category]))
+
+            if pending:
+                verdicts = self._validate_uncached(pending, on_result)
+                # Apply verdicts in input order so cache writes match a sequential run
+                for category, clean_term in pending.items():
+                    is_valid = verdicts[category]
+                    self.initial_results[category] = _verdict_result(
+                        clean_term, is_valid
                     )
-                    points = 10
-                # If not in cache, use Wikipedia validator
-                elif validate_input(clean_term, category):
-                    points = 10
-                    data_manager.add_verified_term(clean_term, category)
+                    if is_valid:
+                        data_manager.add_verified_term(clean_term, category)
+                    elif is_valid is False:
+                        # Only genuine rejections go into the negative cache
+                        data_manager.add_rejected_term(clean_term, category)
 
-            self.initial_results[category] = {"term": clean_term, "points": points}
+            return self.initial_results
 
-        return self.initial_results
+    def _validate_uncached(self, pending, on_result=None):
+        """
+        Classifies each distinct uncached term once in a thread pool, so a term
+        entered in several categories is looked up a single time.
+        """
+        categories_by_term = {}
+        for category, term in pending.items():
+            categories_by_term.setdefault(term, []).append(category)
+
+        workers = max(1, min(VALIDATION_MAX_WORKERS, len(categories_by_term)))
+        verdicts = {}
+        # One memo for the round: terms sharing a page or search fetch it once
+        with validation_round(), ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                submit_in_round(executor, classify_term, term, categories): term
+                for term, categories in categories_by_term.items()
+            }
+            for future in as_completed(futures):
+                term = futures[future]
+                for category, is_valid in future.result().items():
+                    verdicts[category] = is_valid
+                    if on_result:
+                        on_result(category, _verdict_result(term, is_valid))
+        return verdicts
 
     def save_final_results(self, reviewed_results):
         """Calculates final points from reviewed results and saves to CSV."""
@@ -67,7 +138,7 @@ class Game:
 
         round_data = {
             "Letter": self.letter,
-            "Date": datetime.now().strftime("%d-%m-%Y"),
+            "Date": datetime.now().strftime(DATE_FORMAT),
         }
 
         for category, result in reviewed_results.items():
@@ -80,5 +151,6 @@ class Game:
         round_data["Points"] = self.points
         self.final_results = round_data
 
-        data_manager.save_results_to_csv(self.final_results)
+        with tracing.round_scope(self.trace_id, "save"):
+            data_manager.save_results_to_csv(self.final_results)
         logging.info(f"Game saved with {self.points} points.")
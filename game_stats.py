@@ -0,0 +1,175 @@
+import json
+import logging
+import os
+import tombstones
+from history_model import to_points
+
+
+# === Module-level utility functions ===
+def _is_answer(value):
+    """Checks whether a history cell holds a non-empty answer."""
+    return isinstance(value, str) and bool(value.strip())
+
+
+def file_signature(path):
+    """Returns [mtime, size] of a file, or None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def history_signature(path):
+    """Returns the signatures of a history file and its tombstone log."""
+    return [file_signature(path), file_signature(tombstones.log_path(path))]
+
+
+# === Game Statistics ===
+
+
+class GameStats:
+    """Running aggregates over the game history, updated one game at a time."""
+
+    def __init__(self, categories):
+        self.categories = list(categories)
+        self.games = 0
+        self.total_points = 0
+        self.letter_counts = {}
+        self.letter_points = {}
+        self.category_answers = {category: 0 for category in self.categories}
+        self.score_counts = {}
+
+    def _update(self, row, sign):
+        """Adds (sign=1) or removes (sign=-1) a single game row."""
+        letter = row.get("Letter")
+        points = to_points(row.get("Points"))
+
+        self.games += sign
+        self.total_points += sign * points
+        if isinstance(letter, str) and letter:
+            letter = letter.upper()
+            self.letter_counts[letter] = self.letter_counts.get(letter, 0) + sign
+            self.letter_points[letter] = self.letter_points.get(letter, 0) + (
+                sign * points
+            )
+            if self.letter_counts[letter] == 0:
+                del self.letter_counts[letter]
+                del self.letter_points[letter]
+        for category in self.categories:
+            if _is_answer(row.get(category)):
+                self.category_answers[category] += sign
+        self.score_counts[points] = self.score_counts.get(points, 0) + sign
+        if self.score_counts[points] == 0:
+            del self.score_counts[points]
+
+    def add_game(self, row):
+        """Records a saved game given as a dict of column values."""
+        self._update(row, 1)
+
+    def remove_game(self, row):
+        """Forgets a deleted game given as a dict of column values."""
+        self._update(row, -1)
+
+    @classmethod
+    def from_records(cls, records, categories):
+        """Builds the aggregates from a stream of row dicts."""
+        stats = cls(categories)
+        for row in records:
+            stats.add_game(row)
+        return stats
+
+    def letter_distribution(self):
+        """Returns the number of games per letter as a Series for plotting."""
+        import pandas as pd  # Only needed when the statistics window is opened
+
+        return pd.Series(self.letter_counts, dtype=int).sort_index()
+
+    def average_points_by_letter(self):
+        """Returns the mean score per letter as a Series for plotting."""
+        import pandas as pd
+
+        return pd.Series(
+            {
+                letter: self.letter_points[letter] / count
+                for letter, count in self.letter_counts.items()
+            },
+            dtype=float,
+        ).sort_index()
+
+    def category_answer_rates(self):
+        """
+        Returns the share of games with an answer in each category. The history
+        keeps only the total points of a game, so whether an answer was valid
+        is not known per category.
+        """
+        if not self.games:
+            return {category: 0.0 for category in self.categories}
+        return {
+            category: answers / self.games
+            for category, answers in self.category_answers.items()
+        }
+
+    def score_distribution(self):
+        """Returns the number of games per final score, lowest score first."""
+        return dict(sorted(self.score_counts.items()))
+
+    def average_points(self):
+        """Returns the mean score over all games."""
+        return self.total_points / self.games if self.games else 0.0
+
+    def to_dict(self):
+        """Serializes the aggregates for the sidecar file."""
+        return {
+            "categories": self.categories,
+            "games": self.games,
+            "total_points": self.total_points,
+            "letter_counts": self.letter_counts,
+            "letter_points": self.letter_points,
+            "category_answers": self.category_answers,
+            "score_counts": {str(k): v for k, v in self.score_counts.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restores aggregates written by to_dict."""
+        stats = cls(data["categories"])
+        stats.games = data["games"]
+        stats.total_points = data["total_points"]
+        stats.letter_counts = data["letter_counts"]
+        stats.letter_points = data["letter_points"]
+        stats.category_answers = data["category_answers"]
+        stats.score_counts = {int(k): v for k, v in data["score_counts"].items()}
+        return stats
+
+
+def load_sidecar(sidecar_path, history_path, categories):
+    """
+    Returns the stored aggregates if they were written for the current history
+    file and category list, otherwise None.
+    """
+    if not os.path.exists(sidecar_path):
+        return None
+    try:
+        with open(sidecar_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("source") != history_signature(history_path):
+            return None
+        if data["stats"]["categories"] != list(categories):
+            return None
+        return GameStats.from_dict(data["stats"])
+    except (OSError, ValueError, KeyError) as e:
+        logging.warning(f"Ignoring unreadable statistics file '{sidecar_path}': {e}")
+        return None
+
+
+def save_sidecar(stats, sidecar_path, history_path):
+    """Writes the aggregates along with the signature of the history they describe."""
+    data = {"source": history_signature(history_path), "stats": stats.to_dict()}
+    temp_path = f"{sidecar_path}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, sidecar_path)
+    except OSError as e:
+        logging.error(f"Error saving statistics to '{sidecar_path}': {e}")
@@ -0,0 +1,358 @@
+import csv
+import os
+from array import array
+from datetime import date
+from itertools import islice
+import tombstones
+import tracing
+from config import HISTORY_CHUNK_SIZE
+
+DATE_FORMAT = "%d-%m-%Y"
+MISSING = "-"  # Placeholder shown for empty cells
+
+
+# === Module-level utility functions ===
+def date_ordinal(text):
+    """Parses a 'dd-mm-YYYY' date into a sortable day number, 0 if missing or invalid."""
+    if not text:
+        return 0
+    try:
+        day, month, year = text.split("-")
+        return date(int(year), int(month), int(day)).toordinal()
+    except (AttributeError, TypeError, ValueError):
+        return 0
+
+
+def to_points(value):
+    """Converts a CSV or round value to integer points, 0 if missing."""
+    if value is None or value == "":
+        return 0
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def to_cell(value):
+    """Normalizes an answer/text cell: empty strings and NaN become None."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    text = str(value)
+    return text if text != "" else None
+
+
+def _new_column(name):
+    """Creates empty storage for a column: a typed array for points, else a list."""
+    return array("q") if name == "Points" else []
+
+
+def _convert(name, value):
+    """Converts a single value into the storage type of its column."""
+    return to_points(value) if name == "Points" else to_cell(value)
+
+
+def _format(value):
+    """Formats a stored value for CSV output."""
+    return "" if value is None else str(value)
+
+
+# === History Table ===
+
+
+class HistoryTable:
+    """
+    Column-oriented game history: one list (or typed array) per column, plus a
+    parallel list of row labels. Labels are CSV row positions for the CSV backend
+    and game ids for the SQLite backend. Tables returned by queries are read-only.
+    """
+
+    __slots__ = ("columns", "labels", "_data", "_date_keys", "_positions")
+
+    def __init__(self, columns=(), data=None, labels=None):
+        self.columns = list(columns)
+        self._data = data if data is not None else {c: _new_column(c) for c in columns}
+        if labels is None:
+            size = len(self._data[self.columns[0]]) if self.columns else 0
+            labels = list(range(size))
+        self.labels = labels
+        self._date_keys = None
+        self._positions = None
+
+    def __len__(self):
+        return len(self.labels)
+
+    @property
+    def empty(self):
+        """True if the table has no rows."""
+        return not self.labels
+
+    def copy(self):
+        """Returns a copy that is not affected by later in-place changes."""
+        return self.take(range(len(self)))
+
+    def column(self, name):
+        """Returns the storage of one column."""
+        return self._data[name]
+
+    def row(self, position):
+        """Returns one row as a dict of column values."""
+        return {name: self._data[name][position] for name in self.columns}
+
+    def records(self):
+        """Yields every row as a dict of column values."""
+        for position in range(len(self)):
+            yield self.row(position)
+
+    def date_keys(self):
+        """Returns the day number of each row's 'Date' (0 if missing)."""
+        if self._date_keys is None:
+            dates = self._data.get("Date", [None] * len(self))
+            self._date_keys = array("l", map(date_ordinal, dates))
+        return self._date_keys
+
+    def position_of(self, label):
+        """Returns the row position of a label, or None."""
+        if self._positions is None:
+            self._positions = {label: i for i, label in enumerate(self.labels)}
+        return self._positions.get(label)
+
+    # === Derived tables ===
+
+    def take(self, positions):
+        """Returns a new table with the rows at the given positions."""
+        positions = list(positions)
+        data = {}
+        for name in self.columns:
+            source = self._data[name]
+            values = [source[i] for i in positions]
+            data[name] = array("q", values) if name == "Points" else values
+        labels = [self.labels[i] for i in positions]
+        return HistoryTable(self.columns, data, labels)
+
+    def take_labels(self, labels):
+        """Returns a new table with the rows of the given labels, in that order."""
+        return self.take(self.position_of(label) for label in labels)
+
+    def head(self, n):
+        """Returns the first n rows."""
+        return self.take(range(min(n, len(self))))
+
+    def without_label(self, label):
+        """Returns a copy of the table without the row of one label."""
+        return self.take(i for i, own in enumerate(self.labels) if own != label)
+
+    def sort_order(self, criteria):
+        """
+        Returns row positions sorted by [(column, ascending), ...] with the first
+        criterion as the primary key. Missing values sort last, like pandas.
+        """
+        order = list(range(len(self)))
+        for name, ascending in reversed(criteria):
+            values = self.date_keys() if name == "Date" else self._data[name]
+
+            def key(i, values=values):
+                value = values[i]
+                missing = value is None or (name == "Date" and value == 0)
+                if ascending:
+                    return (missing, "" if missing else value)
+                return (not missing, "" if missing else value)
+
+            order.sort(key=key, reverse=not ascending)
+        return order
+
+    def display_rows(self, positions):
+        """Returns Treeview value lists for the given positions."""
+        columns = [self._data[name] for name in self.columns]
+        return [
+            [MISSING if column[i] is None else column[i] for column in columns]
+            for i in positions
+        ]
+
+    # === In-place changes (used by the owner of a table) ===
+
+    def insert(self, position, row, label):
+        """Inserts a row dict at a position; unknown columns are ignored."""
+        for name in self.columns:
+            self._data[name].insert(position, _convert(name, row.get(name)))
+        self.labels.insert(position, label)
+        if self._date_keys is not None:
+            date_key = date_ordinal(row.get("Date")) if "Date" in self._data else 0
+            self._date_keys.insert(position, date_key)
+        self._positions = None
+
+    def append(self, row, label=None):
+        """Appends a row dict at the end."""
+        self.insert(len(self), row, len(self) if label is None else label)
+
+    def delete(self, position):
+        """Removes the row at a position."""
+        for name in self.columns:
+            del self._data[name][position]
+        del self.labels[position]
+        if self._date_keys is not None:
+            del self._date_keys[position]
+        self._positions = None
+
+    def add_column(self, name, fill=None):
+        """Adds a column filled with one value."""
+        self.columns.append(name)
+        if name == "Points":
+            self._data[name] = array("q", [to_points(fill)] * len(self))
+        else:
+            self._data[name] = [fill] * len(self)
+        self._date_keys = None
+
+    def drop_column(self, name):
+        """Removes a column."""
+        self.columns.remove(name)
+        del self._data[name]
+        self._date_keys = None
+
+
+# === CSV Reader and Writer ===
+
+
+def _parsed_rows(reader, width):
+    """Yields the non-empty rows of a CSV reader, padded to the header width."""
+    for line_number, fields in enumerate(reader, start=2):
+        if not fields:
+            continue
+        if len(fields) > width:
+            raise ValueError(
+                f"Expected {width} fields in line {line_number}, saw {len(fields)}"
+            )
+        fields += [""] * (width - len(fields))
+        yield fields
+
+
+def read_history(path):
+    """Reads a history CSV into a HistoryTable, or returns None if it has no header."""
+    if not os.path.isfile(path):
+        return None
+    tracing.count("storage.bytes_read", os.path.getsize(path))
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return None
+        table = HistoryTable(header)
+        columns = [table.column(name) for name in header]
+        converters = [to_points if name == "Points" else to_cell for name in header]
+        deleted = deleted_labels(path)
+        labels = []
+        for label, fields in enumerate(_parsed_rows(reader, len(header))):
+            if label in deleted:
+                continue
+            labels.append(label)
+            for column, convert, value in zip(columns, converters, fields):
+                column.append(convert(value))
+        table.labels = labels
+    return table
+
+
+def iter_history(path, chunk_size=HISTORY_CHUNK_SIZE, skip=0):
+    """
+    Streams a history CSV as HistoryTables of at most chunk_size rows, so only
+    one chunk is in memory at a time. Labels are CSV row positions, as with
+    read_history, and deleted rows are left out. The first `skip` rows are
+    passed over without being parsed into tables. Chunks are never empty; the
+    stream yields nothing if the file is missing or has no rows.
+    """
+    if not os.path.isfile(path):
+        return
+    tracing.count("storage.bytes_read", os.path.getsize(path))
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        deleted = deleted_labels(path)
+        rows = _parsed_rows(reader, len(header))
+        start = sum(1 for _ in islice(rows, skip))
+        while True:
+            fields = list(islice(rows, chunk_size))
+            if not fields:
+                return
+            labels = range(start, start + len(fields))
+            start += len(fields)
+            if deleted:
+                kept = [i for i, label in enumerate(labels) if label not in deleted]
+                if not kept:
+                    continue
+                fields = [fields[i] for i in kept]
+                labels = [labels[i] for i in kept]
+            # Convert column by column; CSV cells are strings, so "" means missing
+            data = {
+                name: (
+                    array("q", map(to_points, values))
+                    if name == "Points"
+                    else [value or None for value in values]
+                )
+                for name, values in zip(header, zip(*fields))
+            }
+            yield HistoryTable(header, data, list(labels))
+
+
+def iter_records(path, chunk_size=HISTORY_CHUNK_SIZE):
+    """Streams (label, row dict) pairs from a history CSV."""
+    for chunk in iter_history(path, chunk_size):
+        yield from zip(chunk.labels, chunk.records())
+
+
+def deleted_labels(path):
+    """Returns the labels of history rows deleted since the last compaction."""
+    return {int(row[0]) for row in tombstones.load(path) if row}
+
+
+def delete_label(path, label):
+    """Marks one row of a history CSV as deleted without rewriting the file."""
+    tombstones.append(path, [label])
+
+
+def write_history(table, path):
+    """Writes a table to a temporary file and renames it over the target."""
+    write_history_chunks(table.columns, [table], path)
+
+
+def write_table_rows(writer, columns, table):
+    """Writes the given columns of a table with a CSV writer; missing ones stay empty."""
+    blank = [None] * len(table)
+    data = [table.column(name) if name in table.columns else blank for name in columns]
+    for position in range(len(table)):
+        writer.writerow([_format(column[position]) for column in data])
+
+
+def write_history_chunks(columns, chunks, path):
+    """
+    Writes the given columns of a stream of tables to a temporary file and
+    renames it over the target. Columns missing from a chunk are left empty.
+    If the stream raises, the target is left as it was.
+    """
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            for table in chunks:
+                write_table_rows(writer, columns, table)
+            tracing.count("storage.bytes_written", f.tell())
+    except BaseException:
+        # The chunks are often read from the target itself; leave it untouched.
+        os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+    # Rows deleted from the old file are not in the new one
+    tombstones.clear(path)
+
+
+def append_row(path, columns, row, write_header=False):
+    """Appends one row dict to a CSV in the given column order."""
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        start = f.tell()
+        writer = csv.writer(f, lineterminator="\n")
+        if write_header:
+            writer.writerow(columns)
+        writer.writerow([_format(_convert(name, row.get(name))) for name in columns])
+        tracing.count("storage.bytes_written", f.tell() - start)
@@ -1,10 +1,8 @@
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
 import data_manager
-import pandas as pd
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from config import HISTORY_GAMES_TO_SHOW
+from config import HISTORY_GAMES_TO_SHOW, HISTORY_PAGE_SIZE
 
 
 # === Helper Functions ===
@@ -49,33 +47,77 @@ def show_info(title, message):
     dialog.wait_window()
 
 
-def _populate_treeview(tree, df):
-    """Clears and populates a Treeview with data from a DataFrame."""
-    display_df = df.copy()
-
-    if "Date" in display_df.columns and pd.api.types.is_datetime64_any_dtype(
-        display_df["Date"]
-    ):
-        display_df["Date"] = display_df["Date"].dt.strftime("%d-%m-%Y")
+class _PagedHistory:
+    """
+    Keeps the full history behind a Treeview but only inserts one page of rows.
+    Sort orders are computed once per criteria list and reused while paging.
+    """
 
-    for item in tree.get_children():
-        tree.delete(item)
-    for i, row in display_df.iterrows():
-        tag = "evenrow" if i % 2 == 0 else "oddrow"
-        tree.insert("", "end", iid=i, values=list(row.fillna("-")), tags=(tag,))
+    def __init__(self, tree, game_data, page_size):
+        self.tree = tree
+        self.table = game_data
+        self.page_size = page_size
+        self.page = 0
+        self.sort_criteria = []
+        self._orders = {}
+        self.on_render = None  # Called after each render, e.g. to update labels
+
+    def _order(self):
+        """Returns the row positions for the current sort criteria."""
+        key = tuple(self.sort_criteria)
+        if key not in self._orders:
+            self._orders[key] = self.table.sort_order(key)
+        return self._orders[key]
+
+    def page_count(self):
+        """Returns the number of pages, at least one."""
+        return max(1, -(-len(self.table) // self.page_size))
+
+    def page_bounds(self):
+        """Returns the first and last row number shown on the current page."""
+        start = self.page * self.page_size
+        return start + 1, min(start + self.page_size, len(self.table))
+
+    def set_sort(self, sort_criteria):
+        """Applies new sort criteria and jumps back to the first page."""
+        self.sort_criteria = list(sort_criteria)
+        self.page = 0
+        self.render()
+
+    def go_to_page(self, page):
+        """Shows another page, clamped to the valid range."""
+        self.page = min(max(page, 0), self.page_count() - 1)
+        self.render()
+
+    def remove(self, iid):
+        """Drops a deleted game from the view and refreshes the current page."""
+        self.table = self.table.without_label(iid)
+        self._orders.clear()
+        self.go_to_page(self.page)
+
+    def render(self):
+        """Replaces the Treeview contents with the rows of the current page."""
+        start = self.page * self.page_size
+        positions = self._order()[start : start + self.page_size]
+        labels = [self.table.labels[i] for i in positions]
+
+        self.tree.delete(*self.tree.get_children())
+        for offset, (iid, values) in enumerate(
+            zip(labels, self.table.display_rows(positions))
+        ):
+            tag = "evenrow" if (start + offset) % 2 == 0 else "oddrow"
+            self.tree.insert("", "end", iid=iid, values=values, tags=(tag,))
+        if self.on_render:
+            self.on_render()
 
 
-def _create_history_sort_controls(parent_frame, tree, game_data):
+def _create_history_sort_controls(parent_frame, pager):
     """Creates and packs the sorting buttons for the history window."""
     sort_frame = ttk.Frame(parent_frame, padding=(10, 0, 10, 10))
     sort_frame.pack(fill="x", side="bottom")
 
     # === State Management for Sorting ===
     sort_criteria = []  # List of tuples (column_name, ascending)
-    original_df = game_data.copy()
-    original_df["Date"] = pd.to_datetime(
-        original_df["Date"], format="%d-%m-%Y", errors="coerce"
-    )
 
     # === UI for Displaying Current Sort ===
     status_frame = ttk.Frame(sort_frame)
@@ -88,19 +130,12 @@ def _create_history_sort_controls(parent_frame, tree, game_data):
 
     # === Core Sorting Logic ===
     def apply_sort():
-        """Applies the current sort_criteria list to the DataFrame and updates the tree."""
+        """Applies the current sort_criteria list through the pager."""
+        pager.set_sort(sort_criteria)
         if not sort_criteria:
-            _populate_treeview(tree, original_df)
             sort_status_label.config(text="Default")
             return
 
-        sort_by_cols = [col for col, asc in sort_criteria]
-        sort_ascending = [asc for col, asc in sort_criteria]
-
-        # Perform the multi-level sort
-        sorted_df = original_df.sort_values(by=sort_by_cols, ascending=sort_ascending)
-        _populate_treeview(tree, sorted_df)
-
         # Update the status label for user feedback
         status_text = ", ".join(
             [f"{col} ({'A-Z' if asc else 'Z-A'})" for col, asc in sort_criteria]
@@ -166,12 +201,14 @@ def create_start_window(
     search_callback,
     show_all_callback,
     stats_callback,
+    ready_callback=None,
 ):
     """
     Creates the main application window with a title and buttons.
     :param start_callback: Function to call when 'Start Game' is clicked.
     :param history_callback: Function to call when 'Show History' is clicked.
     :param n_games_to_show: The number of games to show in the history window.
+    :param ready_callback: Optional function to call once the window is shown.
     """
     root = tk.Tk()
     root.title("City, Country, River")
@@ -213,18 +250,59 @@ def create_start_window(
     root.update_idletasks()
     root.geometry(f"300x{root.winfo_height()}")
 
+    if ready_callback:
+        root.after_idle(ready_callback)
     root.mainloop()
 
 
-def create_stats_window(letter_distribution):
-    """Creates a window to display game statistics, like letter distribution."""
+def _create_stats_summary(parent_frame, stats):
+    """Creates a compact table of the aggregate statistics below the chart."""
+    summary_frame = ttk.Frame(parent_frame, padding=(0, 10, 0, 0))
+    summary_frame.pack(fill="x")
+
+    ttk.Label(
+        summary_frame,
+        text=f"Games played: {stats.games}    "
+        f"Average score: {stats.average_points():.1f}",
+        font=("Helvetica", 10, "bold"),
+    ).pack(anchor="w")
+
+    answer_rates = ", ".join(
+        f"{category} {rate:.0%}"
+        for category, rate in stats.category_answer_rates().items()
+    )
+    ttk.Label(
+        summary_frame, text=f"Answered per category: {answer_rates}", wraplength=560
+    ).pack(anchor="w", pady=(5, 0))
+
+    scores = ", ".join(
+        f"{points} pts: {count}" for points, count in stats.score_distribution().items()
+    )
+    ttk.Label(summary_frame, text=f"Score distribution: {scores}", wraplength=560).pack(
+        anchor="w", pady=(5, 0)
+    )
+
+    average_by_letter = ", ".join(
+        f"{letter} {points:.0f}"
+        for letter, points in stats.average_points_by_letter().items()
+    )
+    ttk.Label(
+        summary_frame,
+        text=f"Average points per letter: {average_by_letter}",
+        wraplength=560,
+    ).pack(anchor="w", pady=(5, 0))
+
+
+def create_stats_window(stats):
+    """Creates a window to display game statistics from the running aggregates."""
+    letter_distribution = stats.letter_distribution()
     if letter_distribution.empty:
         show_info("Statistics", "No game data available to generate statistics.")
         return
 
     stats_window = tk.Toplevel()
     stats_window.title("Game Statistics")
-    stats_window.geometry("600x500")
+    stats_window.geometry("600x650")
     stats_window.transient()
     stats_window.grab_set()
 
@@ -237,6 +315,15 @@ def create_stats_window(letter_distribution):
         font=("Helvetica", 14, "bold"),
     ).pack(pady=(0, 10))
 
+    # Pack the summary first so the chart takes the remaining space
+    summary_container = ttk.Frame(main_frame)
+    summary_container.pack(side="bottom", fill="x")
+    _create_stats_summary(summary_container, stats)
+
+    # matplotlib is slow to import, so it is only loaded once stats are shown
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
     # Create a matplotlib figure
     fig = Figure(figsize=(5, 4), dpi=100)
     ax = fig.add_subplot(111)
@@ -291,11 +378,11 @@ def create_history_window(game_data, title="Game History"):
         tree.heading(col, text=col)
         tree.column(col, width=100, anchor="center")
 
-    # --- Initial data population ---
-    _populate_treeview(tree, game_data)
+    # --- Initial data population (one page at a time) ---
+    pager = _PagedHistory(tree, game_data, HISTORY_PAGE_SIZE)
 
     # --- Sorting Controls ---
-    _create_history_sort_controls(history_window, tree, game_data)
+    _create_history_sort_controls(history_window, pager)
 
     # --- Action Buttons (Delete) ---
     def delete_selected_game():
@@ -312,7 +399,7 @@ def create_history_window(game_data, title="Game History"):
             "Confirm Delete", "Are you sure you want to permanently delete this game?"
         ):
             data_manager.delete_game_by_index(selected_iid)
-            tree.delete(selected_iid)
+            pager.remove(selected_iid)
             show_info("Success", "The selected game has been deleted.")
 
     action_frame = ttk.Frame(history_window, padding=(10, 0, 10, 10))
@@ -322,10 +409,36 @@ def create_history_window(game_data, title="Game History"):
     )
     delete_button.pack(side="right")
 
+    # --- Paging Controls ---
+    prev_button = ttk.Button(
+        action_frame, text="< Prev", command=lambda: pager.go_to_page(pager.page - 1)
+    )
+    prev_button.pack(side="left")
+    page_label = ttk.Label(action_frame)
+    page_label.pack(side="left", padx=10)
+    next_button = ttk.Button(
+        action_frame, text="Next >", command=lambda: pager.go_to_page(pager.page + 1)
+    )
+    next_button.pack(side="left")
+
+    def update_page_controls():
+        """Refreshes the row range label and the paging button states."""
+        first, last = pager.page_bounds()
+        page_label.config(text=f"Rows {first}-{last} of {len(pager.table)}")
+        prev_button.config(state="normal" if pager.page > 0 else "disabled")
+        last_page = pager.page >= pager.page_count() - 1
+        next_button.config(state="disabled" if last_page else "normal")
 
-def create_review_window(results, letter, confirm_callback):
+    pager.on_render = update_page_controls
+    pager.render()
+
+
+def create_review_window(results, letter, confirm_callback, updates=None):
     """
     Creates a window for the user to review and override validation results.
+    :param results: Dict of category -> {"term", "points"} to show initially.
+    :param updates: Optional queue of (category, result) verdicts that arrive
+        while validation is still running. A (None, results) item marks the end.
     """
     review_window = tk.Toplevel()
     review_window.title(f"Review Results for Letter '{letter}'")
@@ -343,6 +456,8 @@ def create_review_window(results, letter, confirm_callback):
     ).pack(pady=(0, 10))
 
     check_vars = {}
+    check_buttons = {}
+    status_labels = {}
 
     for category, result in results.items():
         frame = ttk.Frame(main_frame, padding=5)
@@ -353,12 +468,21 @@ def create_review_window(results, letter, confirm_callback):
 
         chk = ttk.Checkbutton(frame, variable=is_correct)
         chk.pack(side="left", padx=(0, 10))
+        check_buttons[category] = chk
 
         label_text = (
             f"{category}: '{result['term']}'" if result["term"] else f"{category}: -"
         )
         ttk.Label(frame, text=label_text).pack(side="left")
 
+        if updates is not None:
+            # Locked until its verdict arrives, which would overwrite a choice
+            chk.state(["disabled"])
+            status_labels[category] = ttk.Label(
+                frame, text="Checking...", font=("Helvetica", 9, "italic")
+            )
+            status_labels[category].pack(side="right")
+
     def on_confirm():
         """Gathers the final results and passes them to the callback."""
         final_results = {}
@@ -372,7 +496,53 @@ def create_review_window(results, letter, confirm_callback):
         review_window.destroy()
         confirm_callback(final_results)
 
-    ttk.Button(main_frame, text="Confirm and Save", command=on_confirm).pack(pady=20)
+    confirm_button = ttk.Button(main_frame, text="Confirm and Save", command=on_confirm)
+    if updates is None:
+        confirm_button.pack(pady=20)
+        return
+
+    # === Live updates while validation runs in the background ===
+    progress = ttk.Progressbar(main_frame, maximum=len(results), mode="determinate")
+    progress.pack(fill="x", pady=(15, 0))
+    confirm_button.config(state="disabled")
+    confirm_button.pack(pady=20)
+    received = set()
+
+    def apply_result(category, result):
+        """Shows one category's verdict, unlocks its box and advances the progress."""
+        check_vars[category].set(1 if result["points"] > 0 else 0)
+        check_buttons[category].state(["!disabled"])
+        if not result["term"]:
+            status_labels[category].config(text="")
+        elif result.get("unverified"):
+            status_labels[category].config(text="Lookup failed")
+        else:
+            verdict = "Valid" if result["points"] > 0 else "Not found"
+            status_labels[category].config(text=verdict)
+        received.add(category)
+        progress.config(value=len(received))
+
+    def poll_updates():
+        """Drains the update queue without blocking the Tk mainloop."""
+        if not review_window.winfo_exists():
+            return
+        while True:
+            try:
+                category, result = updates.get_nowait()
+            except queue.Empty:
+                break
+            if category is None:
+                # Validation finished. Only fill in verdicts that never streamed
+                # in, so boxes the user already changed keep their state.
+                for final_category, final_result in result.items():
+                    if final_category not in received:
+                        apply_result(final_category, final_result)
+                confirm_button.config(state="normal")
+                return
+            apply_result(category, result)
+        review_window.after(100, poll_updates)
+
+    poll_updates()
 
 
 def create_search_window(search_callback):
@@ -1,10 +1,15 @@
+import startup_timing  # Must come first so it can time the imports below
 import data_manager
 import interface
+import queue
+import threading
 import warnings
 from game_logic import Game, get_letter
 import logging
 from config import HISTORY_GAMES_TO_SHOW, CATEGORIES, TIME_LIMIT
 
+startup_timing.mark("imports")
+
 
 class App:
     """The main application class that manages state and control flow."""
@@ -13,7 +18,10 @@ class App:
         self.setup_logging()
         logging.info("Application starting up...")
         data_manager.synchronize_csv()
+        startup_timing.mark("synchronize_csv")
         data_manager.load_verified_terms()
+        data_manager.load_rejected_terms()
+        startup_timing.mark("load term caches")
 
     def setup_logging(self):
         """Configures the application-wide logging."""
@@ -23,10 +31,8 @@ class App:
             datefmt="%d-%m-%Y %H:%M:%S",
         )
         # Suppress warnings and logs from external libraries to keep logs clean.
-        logging.getLogger("wikipedia").setLevel(logging.WARNING)
         logging.getLogger("urllib3").setLevel(logging.WARNING)
         logging.getLogger("matplotlib").setLevel(logging.WARNING)
-        warnings.filterwarnings("ignore", category=UserWarning, module="wikipedia")
         warnings.filterwarnings("ignore", category=UserWarning, module="urllib3")
 
     def run(self):
@@ -37,7 +43,15 @@ class App:
             search_callback=self.search_by_letter,
             show_all_callback=self.show_all_games,
             stats_callback=self.show_stats,
+            ready_callback=self.on_start_window_ready,
         )
+        # The start window has closed; fold pending deletes into the CSV files
+        data_manager.compact_storage()
+
+    def on_start_window_ready(self):
+        """Called once the start window is drawn; logs the opt-in startup report."""
+        startup_timing.mark("start window")
+        startup_timing.report()
 
     def start_game(self):
         """Starts a new game round."""
@@ -46,18 +60,36 @@ class App:
         categories = CATEGORIES
 
         def on_submit(inputs):
-            """Callback that handles game submission and review flow."""
+            """Callback that starts validation and opens the review window at once."""
             game = Game(letter)
-            initial_results = game.validate_answers(inputs)
+            updates = queue.Queue()
+            pending_results = {
+                category: {"term": term.strip() if term else "", "points": 0}
+                for category, term in inputs.items()
+            }
+
+            def run_validation():
+                """Validates the answers off the Tk thread, reporting each verdict."""
+                try:
+                    game.validate_answers(
+                        inputs, on_result=lambda c, r: updates.put((c, r))
+                    )
+                except Exception as e:
+                    logging.error(f"Validation failed unexpectedly: {e}")
+                    game.initial_results = {**pending_results, **game.initial_results}
+                updates.put((None, game.initial_results))
 
             def on_review_confirmed(final_results):
                 """Callback for when the user confirms their reviewed scores."""
                 # Compare initial and final results to update the cache
+                initial_results = game.initial_results
                 for category, final_result in final_results.items():
                     initial_result = initial_results[category]
                     term = final_result["term"]
 
-                    if not term:
+                    # Answers whose lookup failed stay out of the caches; the
+                    # next round looks them up again.
+                    if not term or initial_result.get("unverified"):
                         continue
 
                     was_correct = initial_result["points"] > 0
@@ -69,6 +101,7 @@ class App:
                     elif not was_correct and is_now_correct:
                         # User checked an invalid term, so add it to the cache.
                         data_manager.add_verified_term(term, category)
+                        data_manager.remove_rejected_term(term, category)
 
                 game.save_final_results(final_results)
                 logging.info("Game processing finished. Returning to main menu.")
@@ -76,7 +109,10 @@ class App:
                     "Game Saved", f"Your final score is {game.points} points."
                 )
 
-            interface.create_review_window(initial_results, letter, on_review_confirmed)
+            threading.Thread(target=run_validation, daemon=True).start()
+            interface.create_review_window(
+                pending_results, letter, on_review_confirmed, updates=updates
+            )
 
         interface.create_game_window(
             letter, categories, time_limit=TIME_LIMIT, submit_callback=on_submit
@@ -111,8 +147,8 @@ class App:
     def show_stats(self):
         """Fetches game statistics and displays them in a new window."""
         logging.info("Fetching game statistics...")
-        letter_distribution = data_manager.get_letter_distribution()
-        interface.create_stats_window(letter_distribution)
+        stats = data_manager.get_game_stats()
+        interface.create_stats_window(stats)
 
 
 if __name__ == "__main__":
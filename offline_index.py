@@ -0,0 +1,272 @@
+"""
+Offline Wikipedia index used as an alternative validation backend.
+
+The index is a single read-only file built from a German Wikipedia dump:
+
+    header   magic (8 bytes), record count (uint64), offset table position (uint64)
+    records  kind (1 byte), key length (uint16), payload length (uint32), key, payload
+    offsets  one uint64 per record, sorted by key
+
+Keys are casefolded, UTF-8 encoded titles. The payload depends on the kind:
+a page stores "title<US>summary", a redirect stores its target title and a
+disambiguation page stores "title<US>option<US>option...".
+"""
+
+import argparse
+import bz2
+import gzip
+import logging
+import mmap
+import os
+import struct
+import xml.etree.ElementTree as ET
+from config import OFFLINE_INDEX_FILE
+
+MAGIC = b"CCRIDX1\0"
+HEADER = struct.Struct("<8sQQ")
+RECORD_HEADER = struct.Struct("<BHI")
+OFFSET = struct.Struct("<Q")
+SEPARATOR = "\x1f"
+MAX_SUMMARY_LENGTH = 1500
+MAX_SEARCH_RESULTS = 10
+MAX_REDIRECT_HOPS = 3
+
+KIND_PAGE = ord("P")
+KIND_REDIRECT = ord("R")
+KIND_DISAMBIGUATION = ord("D")
+# When two titles casefold to the same key, the higher priority record wins
+_KIND_PRIORITY = {KIND_DISAMBIGUATION: 2, KIND_PAGE: 2, KIND_REDIRECT: 1}
+_DISAMBIGUATION_MARKERS = ("(begriffsklärung)", " steht für:")
+
+_index = None
+
+
+# === Module-level utility functions ===
+def _make_key(title):
+    """Builds the binary search key for a title."""
+    return title.strip().casefold().encode("utf-8")
+
+
+def _open_dump(path):
+    """Opens a plain, gzip or bz2 compressed dump file for binary reading."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    return open(path, "rb")
+
+
+def _read_abstracts(path):
+    """Yields (title, abstract) pairs from a Wikipedia abstracts XML dump."""
+    with _open_dump(path) as dump:
+        for _, element in ET.iterparse(dump, events=("end",)):
+            if element.tag != "doc":
+                continue
+            title = element.findtext("title") or ""
+            if title.startswith("Wikipedia:"):
+                title = title[len("Wikipedia:") :]
+            abstract = (element.findtext("abstract") or "").strip()
+            element.clear()
+            if title.strip():
+                yield title.strip(), abstract
+
+
+def _read_tsv(path):
+    """Yields the tab-separated fields of every non-empty line in a file."""
+    with open(path, encoding="utf-8") as tsv:
+        for line in tsv:
+            fields = [field.strip() for field in line.rstrip("\n").split("\t")]
+            if len(fields) > 1 and fields[0]:
+                yield fields
+
+
+# === Index Builder ===
+
+
+def build_index(abstracts_path, output_path, redirects_path=None, disambig_path=None):
+    """
+    Compiles a Wikipedia abstracts dump into the offline index format.
+    :param abstracts_path: Abstracts XML dump (optionally .gz or .bz2).
+    :param output_path: Where to write the index file.
+    :param redirects_path: Optional TSV of "source<TAB>target" redirect titles.
+    :param disambig_path: Optional TSV of "title<TAB>option<TAB>option..." lines.
+    """
+    records = {}
+
+    def add_record(title, kind, payload):
+        key = _make_key(title)
+        existing = records.get(key)
+        if existing and _KIND_PRIORITY[existing[0]] >= _KIND_PRIORITY[kind]:
+            return
+        records[key] = (kind, payload.encode("utf-8"))
+
+    disambiguations = {}
+    if disambig_path:
+        for fields in _read_tsv(disambig_path):
+            disambiguations[_make_key(fields[0])] = (fields[0], fields[1:])
+
+    for title, abstract in _read_abstracts(abstracts_path):
+        key = _make_key(title)
+        lowered = f"{title.lower()} {abstract.lower()}"
+        if key in disambiguations:
+            _, options = disambiguations.pop(key)
+            add_record(title, KIND_DISAMBIGUATION, SEPARATOR.join([title] + options))
+        elif any(marker in lowered for marker in _DISAMBIGUATION_MARKERS):
+            add_record(title, KIND_DISAMBIGUATION, title)
+        else:
+            summary = abstract[:MAX_SUMMARY_LENGTH]
+            add_record(title, KIND_PAGE, f"{title}{SEPARATOR}{summary}")
+
+    # Disambiguation pages missing from the abstracts dump
+    for title, options in disambiguations.values():
+        add_record(title, KIND_DISAMBIGUATION, SEPARATOR.join([title] + options))
+
+    if redirects_path:
+        for source, target, *_ in _read_tsv(redirects_path):
+            add_record(source, KIND_REDIRECT, target)
+
+    keys = sorted(records)
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, 0, 0))
+        offsets = []
+        for key in keys:
+            kind, payload = records[key]
+            offsets.append(out.tell())
+            out.write(RECORD_HEADER.pack(kind, len(key), len(payload)))
+            out.write(key)
+            out.write(payload)
+        offset_table = out.tell()
+        for offset in offsets:
+            out.write(OFFSET.pack(offset))
+        out.seek(0)
+        out.write(HEADER.pack(MAGIC, len(keys), offset_table))
+    os.replace(temp_path, output_path)
+    logging.info(f"Wrote {len(keys)} titles to offline index '{output_path}'.")
+    return len(keys)
+
+
+# === Index Reader ===
+
+
+class OfflineIndex:
+    """Answers page and search lookups from a memory-mapped index file."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._offset_table = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not an offline Wikipedia index.")
+
+    def __len__(self):
+        return self._count
+
+    def _offset_at(self, position):
+        """Returns the file offset of the record at a sorted position."""
+        return OFFSET.unpack_from(
+            self._map, self._offset_table + position * OFFSET.size
+        )[0]
+
+    def _key_at(self, position):
+        """Returns the key stored at a position in the sorted offset table."""
+        offset = self._offset_at(position)
+        _, key_length, _ = RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + RECORD_HEADER.size
+        return self._map[start : start + key_length]
+
+    def _record_at(self, position):
+        """Returns (kind, payload) for a position in the sorted offset table."""
+        offset = self._offset_at(position)
+        kind, key_length, payload_length = RECORD_HEADER.unpack_from(self._map, offset)
+        start = offset + RECORD_HEADER.size + key_length
+        return kind, self._map[start : start + payload_length].decode("utf-8")
+
+    def _lower_bound(self, key):
+        """Returns the first position whose key is not less than the given key."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _lookup(self, title):
+        """Returns (kind, payload) for an exact title, or None."""
+        key = _make_key(title)
+        position = self._lower_bound(key)
+        if position < self._count and self._key_at(position) == key:
+            return self._record_at(position)
+        return None
+
+    def search(self, query):
+        """Returns up to MAX_SEARCH_RESULTS titles, the exact match first."""
+        prefix = _make_key(query)
+        if not prefix:
+            return []
+        results = []
+        position = self._lower_bound(prefix)
+        while position < self._count and len(results) < MAX_SEARCH_RESULTS:
+            if not self._key_at(position).startswith(prefix):
+                break
+            kind, payload = self._record_at(position)
+            title = payload.split(SEPARATOR, 1)[0]
+            if title not in results:
+                results.append(title)
+            position += 1
+        return results
+
+    def page(self, title, auto_suggest=False):
+        """
+        Returns a page outcome in the same shape the online backend caches:
+        {"title", "summary"}, {"error": "missing"} or {"error": "ambiguous"}.
+        """
+        if auto_suggest:
+            # Offline stand-in for Wikipedia's suggestion: the best prefix match.
+            suggestions = self.search(title)
+            if not suggestions:
+                return {"error": "missing"}
+            title = suggestions[0]
+
+        record = self._lookup(title)
+        hops = 0
+        while record and record[0] == KIND_REDIRECT and hops < MAX_REDIRECT_HOPS:
+            record = self._lookup(record[1])
+            hops += 1
+
+        if record is None or record[0] == KIND_REDIRECT:
+            return {"error": "missing"}
+        kind, payload = record
+        if kind == KIND_DISAMBIGUATION:
+            return {"error": "ambiguous", "options": payload.split(SEPARATOR)[1:]}
+        page_title, summary = payload.split(SEPARATOR, 1)
+        return {"title": page_title, "summary": summary}
+
+    def close(self):
+        """Releases the memory map and the underlying file."""
+        self._map.close()
+        self._file.close()
+
+
+def get_index():
+    """Returns the shared offline index, opening OFFLINE_INDEX_FILE on first use."""
+    global _index
+    if _index is None:
+        _index = OfflineIndex(OFFLINE_INDEX_FILE)
+        logging.info(f"Opened offline index with {len(_index)} titles.")
+    return _index
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(
+        description="Build the offline Wikipedia index from a dump."
+    )
+    parser.add_argument("abstracts", help="Abstracts XML dump (.xml, .gz or .bz2).")
+    parser.add_argument("-o", "--output", default=OFFLINE_INDEX_FILE)
+    parser.add_argument("--redirects", help="TSV file of source/target redirects.")
+    parser.add_argument("--disambiguations", help="TSV file of title/options.")
+    args = parser.parse_args()
+    build_index(args.abstracts, args.output, args.redirects, args.disambiguations)
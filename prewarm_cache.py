@@ -0,0 +1,170 @@
+import argparse
+import csv
+import logging
+import os
+import data_manager
+from wikipedia_scraper import validate_many
+from config import (
+    BATCH_CHECKPOINT_FILE,
+    BATCH_CHUNK_SIZE,
+    BATCH_VALIDATION_RATE,
+    CATEGORIES,
+    VALIDATION_MAX_WORKERS,
+)
+
+
+# === Module-level utility functions ===
+def read_wordlist(path, category=None):
+    """
+    Reads (term, category) pairs from a wordlist.
+    With a category, every non-empty line that does not start with '#' is a term.
+    Without one, the file is a CSV with 'Term' and 'Category' columns, like
+    verified_terms.csv.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if category:
+            return [
+                (line.strip(), category)
+                for line in f
+                if line.strip() and not line.startswith("#")
+            ]
+        return [
+            (row["Term"].strip(), row["Category"].strip()) for row in csv.DictReader(f)
+        ]
+
+
+def load_checkpoint(path):
+    """Returns the (category, casefolded term) pairs a previous run already checked."""
+    if not os.path.exists(path):
+        return set()
+    with open(path, newline="", encoding="utf-8") as f:
+        return {(row["Category"], row["Term"].casefold()) for row in csv.DictReader(f)}
+
+
+def _append_checkpoint(path, verdicts):
+    """Appends (term, category, is_valid) rows to the checkpoint file."""
+    write_header = not os.path.exists(path)
+    with open(path, "a", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        if write_header:
+            writer.writerow(["Term", "Category", "Valid"])
+        writer.writerows(verdicts)
+
+
+def _pending_terms(pairs, checked):
+    """Drops unknown categories, duplicates and terms that are already cached."""
+    pending = []
+    seen = set(checked)
+    for term, category in pairs:
+        if category not in CATEGORIES:
+            logging.warning(f"Skipping '{term}': unknown category '{category}'.")
+            continue
+        key = (category, term.casefold())
+        if not term or key in seen:
+            continue
+        seen.add(key)
+        if data_manager.is_term_verified(term, category):
+            continue
+        if data_manager.is_term_rejected(term, category):
+            continue
+        pending.append((term, category))
+    return pending
+
+
+# === Pre-warming ===
+
+
+def prewarm(
+    pairs,
+    checkpoint_file=BATCH_CHECKPOINT_FILE,
+    chunk_size=BATCH_CHUNK_SIZE,
+    rate_limit=BATCH_VALIDATION_RATE,
+    max_workers=VALIDATION_MAX_WORKERS,
+):
+    """
+    Validates the uncached pairs chunk by chunk and stores the verdicts.
+    Each chunk is written to the term caches before it is checkpointed, so an
+    interrupted run can be resumed without losing or repeating finished work.
+    Terms whose lookup failed are neither cached nor checkpointed, so the next
+    run retries them.
+    """
+    pending = _pending_terms(pairs, load_checkpoint(checkpoint_file))
+    logging.info(f"{len(pending)} of {len(pairs)} terms need a Wikipedia lookup.")
+
+    verified_count = 0
+    failed_count = 0
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start : start + chunk_size]
+        terms_by_category = {}
+        for term, category in chunk:
+            terms_by_category.setdefault(category, []).append(term)
+
+        results = validate_many(
+            terms_by_category, max_workers=max_workers, rate_limit=rate_limit
+        )
+        verdicts = [
+            (term, category, results[category][term])
+            for term, category in chunk
+            if results[category][term] is not None
+        ]
+        failed_count += len(chunk) - len(verdicts)
+        verified = [(term, category) for term, category, valid in verdicts if valid]
+        rejected = [(term, category) for term, category, valid in verdicts if not valid]
+        verified_count += data_manager.add_verified_terms(verified)
+        data_manager.add_rejected_terms(rejected)
+        _append_checkpoint(checkpoint_file, verdicts)
+        logging.info(
+            f"Checked {min(start + chunk_size, len(pending))}/{len(pending)} terms "
+            f"({len(verified)} verified in this chunk)."
+        )
+
+    # Everything is in the caches now; the next run starts from scratch.
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+    if failed_count:
+        logging.warning(
+            f"{failed_count} terms could not be looked up and were not cached; "
+            f"run the wordlist again to retry them."
+        )
+    logging.info(f"Pre-warming finished. Added {verified_count} verified terms.")
+    return verified_count
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(
+        description="Validate a wordlist and add the results to the term caches."
+    )
+    parser.add_argument(
+        "wordlist",
+        help="CSV with 'Term' and 'Category' columns, or one term per line with --category.",
+    )
+    parser.add_argument(
+        "--category", choices=CATEGORIES, help="Category of a plain wordlist."
+    )
+    parser.add_argument("--checkpoint", default=BATCH_CHECKPOINT_FILE)
+    parser.add_argument("--chunk-size", type=int, default=BATCH_CHUNK_SIZE)
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=BATCH_VALIDATION_RATE,
+        help="Maximum lookups started per second.",
+    )
+    parser.add_argument("--workers", type=int, default=VALIDATION_MAX_WORKERS)
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Write span timings and counters to the trace log (see tracing.py).",
+    )
+    args = parser.parse_args()
+
+    data_manager.load_verified_terms()
+    data_manager.load_rejected_terms()
+    prewarm(
+        read_wordlist(args.wordlist, args.category),
+        checkpoint_file=args.checkpoint,
+        chunk_size=args.chunk_size,
+        rate_limit=args.rate,
+        max_workers=args.workers,
+    )
@@ -0,0 +1,121 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from config import (
+    RESPONSE_CACHE_FILE,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    RESPONSE_CACHE_TOUCH_INTERVAL,
+    RESPONSE_CACHE_TTL,
+)
+
+_lock = threading.Lock()
+_connection = None
+
+
+# === Module-level utility functions ===
+def _make_key(language, operation, query):
+    """Builds the primary key for a cached response."""
+    return f"{language}|{operation}|{query}"
+
+
+def _get_connection():
+    """Opens the cache database on first use and creates its table if needed."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(RESPONSE_CACHE_FILE, check_same_thread=False)
+        _connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        _connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)"
+        )
+        _connection.commit()
+    return _connection
+
+
+def _evict(connection):
+    """Drops expired entries and trims the cache to its size cap (LRU order)."""
+    connection.execute("DELETE FROM responses WHERE expires < ?", (time.time(),))
+    (count,) = connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+    overflow = count - RESPONSE_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY last_access ASC LIMIT ?
+            )
+            """,
+            (overflow,),
+        )
+        logging.debug(f"Evicted {overflow} least recently used cached responses.")
+
+
+# === Response Cache ===
+
+
+def get(language, operation, query):
+    """
+    Returns the cached response for a lookup, or None if missing or expired.
+    The LRU timestamp is refreshed at most once per RESPONSE_CACHE_TOUCH_INTERVAL,
+    so most hits are plain reads that don't take a write transaction.
+    """
+    key = _make_key(language, operation, query)
+    now = time.time()
+    try:
+        with _lock:
+            connection = _get_connection()
+            row = connection.execute(
+                "SELECT value, expires, last_access FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires, last_access = row
+            if expires < now:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                connection.commit()
+                return None
+            if now - last_access >= RESPONSE_CACHE_TOUCH_INTERVAL:
+                connection.execute(
+                    "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                )
+                connection.commit()
+    except sqlite3.Error as e:
+        logging.error(f"Error reading from the response cache: {e}")
+        return None
+    return json.loads(value)
+
+
+def put(language, operation, query, value, ttl=None):
+    """Stores a JSON-serializable response with a time-to-live in seconds."""
+    key = _make_key(language, operation, query)
+    now = time.time()
+    expires = now + (RESPONSE_CACHE_TTL if ttl is None else ttl)
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), expires, now),
+            )
+            _evict(connection)
+            connection.commit()
+    except sqlite3.Error as e:
+        logging.error(f"Error writing to the response cache: {e}")
+
+
+def clear():
+    """Removes every cached response."""
+    with _lock:
+        connection = _get_connection()
+        connection.execute("DELETE FROM responses")
+        connection.commit()
@@ -0,0 +1,363 @@
+import argparse
+import csv
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+import history_model
+import tombstones
+from history_model import HistoryTable
+from config import CATEGORIES, HISTORY_FILE, SQLITE_FILE, VERIFIED_TERMS_FILE
+
+_lock = threading.Lock()
+_connection = None
+
+
+# === Module-level utility functions ===
+def _quote(column):
+    """Quotes a column name for use in SQL."""
+    return '"' + column.replace('"', '""') + '"'
+
+
+def _to_iso_date(value):
+    """Converts a 'dd-mm-YYYY' date into sortable ISO format, or None."""
+    try:
+        return datetime.strptime(str(value), history_model.DATE_FORMAT).strftime(
+            "%Y-%m-%d"
+        )
+    except ValueError:
+        return None
+
+
+def _from_iso_date(value):
+    """Converts a stored ISO date back into the 'dd-mm-YYYY' history format."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").strftime(history_model.DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_cell(value):
+    """Stores empty answers and missing values as NULL."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def _get_connection():
+    """Opens the database in WAL mode on first use and creates the schema."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(SQLITE_FILE, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute("PRAGMA synchronous=NORMAL")
+        _connection.executescript("""
+            CREATE TABLE IF NOT EXISTS games (
+                id INTEGER PRIMARY KEY,
+                Date TEXT,
+                Letter TEXT,
+                Points INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_games_date ON games (Date);
+            CREATE INDEX IF NOT EXISTS idx_games_letter ON games (Letter, Date);
+            CREATE TABLE IF NOT EXISTS verified_terms (
+                Term TEXT NOT NULL,
+                Category TEXT NOT NULL,
+                TermKey TEXT NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_verified_terms
+                ON verified_terms (Category, TermKey);
+            """)
+        for category in CATEGORIES:
+            _ensure_category_column(_connection, category)
+        _connection.commit()
+    return _connection
+
+
+def _game_columns(connection):
+    """Returns the answer/category columns of the games table."""
+    return [
+        row[1]
+        for row in connection.execute("PRAGMA table_info(games)")
+        if row[1] not in ("id", "Date", "Letter", "Points")
+    ]
+
+
+def _ensure_category_column(connection, category):
+    """Adds a column for a category if the games table does not have it yet."""
+    if category not in _game_columns(connection):
+        connection.execute(f"ALTER TABLE games ADD COLUMN {_quote(category)} TEXT")
+
+
+def _query_games(where="", params=(), limit=None):
+    """Runs a games query and returns a HistoryTable shaped like the CSV history."""
+    with _lock:
+        connection = _get_connection()
+        categories = sorted(_game_columns(connection))
+        columns = ["Date", "Letter"] + categories + ["Points"]
+        sql = (
+            f"SELECT id, {', '.join(_quote(c) for c in columns)} FROM games {where} "
+            "ORDER BY Date IS NULL, Date DESC, id DESC"
+        )
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = connection.execute(sql, params).fetchall()
+
+    table = HistoryTable(columns)
+    for row in rows:
+        values = dict(zip(columns, row[1:]))
+        values["Date"] = _from_iso_date(values["Date"])
+        table.append(values, label=row[0])
+    return table
+
+
+# === Verified Terms ===
+
+
+def is_term_verified(term, category):
+    """Checks if a term/category pair exists, using the (Category, TermKey) index."""
+    with _lock:
+        row = (
+            _get_connection()
+            .execute(
+                "SELECT 1 FROM verified_terms WHERE Category = ? AND TermKey = ?",
+                (category, term.casefold()),
+            )
+            .fetchone()
+        )
+    return row is not None
+
+
+def add_verified_term(term, category):
+    """Adds a verified term, ignoring duplicates."""
+    with _lock:
+        connection = _get_connection()
+        connection.execute(
+            "INSERT OR IGNORE INTO verified_terms VALUES (?, ?, ?)",
+            (term, category, term.casefold()),
+        )
+        connection.commit()
+    logging.info(f"Cached '{term}' for category '{category}'.")
+
+
+def add_verified_terms(pairs):
+    """Adds many verified terms in one transaction. Returns the number added."""
+    with _lock:
+        connection = _get_connection()
+        before = connection.total_changes
+        connection.executemany(
+            "INSERT OR IGNORE INTO verified_terms VALUES (?, ?, ?)",
+            [(term, category, term.casefold()) for term, category in pairs],
+        )
+        connection.commit()
+        added = connection.total_changes - before
+    logging.info(f"Cached {added} verified terms.")
+    return added
+
+
+def remove_verified_term(term, category):
+    """Removes a term/category pair."""
+    with _lock:
+        connection = _get_connection()
+        cursor = connection.execute(
+            "DELETE FROM verified_terms WHERE Category = ? AND TermKey = ?",
+            (category, term.casefold()),
+        )
+        connection.commit()
+    if cursor.rowcount:
+        logging.info(f"Removed '{term}' for category '{category}' from cache.")
+
+
+def count_verified_terms():
+    """Returns the number of stored verified terms."""
+    with _lock:
+        (count,) = (
+            _get_connection().execute("SELECT COUNT(*) FROM verified_terms").fetchone()
+        )
+    return count
+
+
+# === Game History ===
+
+
+def _game_values(data):
+    """Converts a round's column values into the form stored in the games table."""
+    values = {column: _to_cell(value) for column, value in data.items()}
+    if "Date" in values:
+        values["Date"] = _to_iso_date(values["Date"])
+    if values.get("Letter"):
+        values["Letter"] = str(values["Letter"]).upper()
+    values["Points"] = int(values.get("Points") or 0)
+    return values
+
+
+def save_game(data):
+    """Inserts one round, adding columns for categories the table does not know."""
+    with _lock:
+        connection = _get_connection()
+        for column in data:
+            if column not in ("Date", "Letter", "Points"):
+                _ensure_category_column(connection, column)
+        values = _game_values(data)
+        connection.execute(
+            f"INSERT INTO games ({', '.join(_quote(c) for c in values)}) "
+            f"VALUES ({', '.join('?' for _ in values)})",
+            list(values.values()),
+        )
+        connection.commit()
+
+
+def delete_game(game_id):
+    """Deletes one game by id. Returns True if a row was removed."""
+    with _lock:
+        connection = _get_connection()
+        cursor = connection.execute("DELETE FROM games WHERE id = ?", (int(game_id),))
+        connection.commit()
+    return cursor.rowcount > 0
+
+
+def get_all_games():
+    """Returns all games, most recent first, indexed by game id."""
+    return _query_games()
+
+
+def get_last_games(n):
+    """Returns the n most recent games."""
+    return _query_games(limit=n)
+
+
+def get_games_by_letter(letter):
+    """Returns the games for one letter using the (Letter, Date) index."""
+    return _query_games("WHERE Letter = ?", (letter.upper(),))
+
+
+def get_game_aggregates(categories):
+    """
+    Computes the game statistics with SQL aggregates instead of a table scan in
+    Python. Returns them in the format of GameStats.to_dict.
+    """
+    with _lock:
+        connection = _get_connection()
+        stored = set(_game_columns(connection))
+        games, total_points = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(Points), 0) FROM games"
+        ).fetchone()
+        by_letter = connection.execute(
+            "SELECT Letter, COUNT(*), SUM(Points) FROM games "
+            "WHERE Letter IS NOT NULL AND Letter != '' GROUP BY Letter"
+        ).fetchall()
+        by_score = connection.execute(
+            "SELECT Points, COUNT(*) FROM games GROUP BY Points"
+        ).fetchall()
+        answered = [c for c in categories if c in stored]
+        answers = (
+            connection.execute(
+                "SELECT "
+                + ", ".join(
+                    f"COALESCE(SUM(TRIM({_quote(c)}) != ''), 0)" for c in answered
+                )
+                + " FROM games"
+            ).fetchone()
+            if answered
+            else ()
+        )
+    category_answers = dict.fromkeys(categories, 0)
+    category_answers.update(zip(answered, answers))
+    return {
+        "categories": list(categories),
+        "games": games,
+        "total_points": total_points,
+        "letter_counts": {letter: count for letter, count, _ in by_letter},
+        "letter_points": {letter: points for letter, _, points in by_letter},
+        "category_answers": category_answers,
+        "score_counts": {str(points): count for points, count in by_score},
+    }
+
+
+def synchronize_with_config():
+    """Drops obsolete category columns and adjusts points, like the CSV migration."""
+    with _lock:
+        connection = _get_connection()
+        for column in _game_columns(connection):
+            if column in CATEGORIES:
+                continue
+            cursor = connection.execute(
+                f"UPDATE games SET Points = Points - 10 "
+                f"WHERE {_quote(column)} IS NOT NULL AND {_quote(column)} != ''"
+            )
+            connection.execute(f"ALTER TABLE games DROP COLUMN {_quote(column)}")
+            logging.info(
+                f"Removed obsolete category '{column}' and adjusted points for {cursor.rowcount} rows."
+            )
+        connection.commit()
+
+
+# === Migration ===
+
+
+def migrate_from_csv(
+    history_file=HISTORY_FILE, verified_terms_file=VERIFIED_TERMS_FILE
+):
+    """
+    One-shot import of the CSV history and verified terms into SQLite. The
+    history is inserted in a single transaction, so an interrupted import
+    leaves the games table empty and a rerun imports everything.
+    """
+    history = None
+    if os.path.isfile(history_file):
+        history = history_model.read_history(history_file) or HistoryTable()
+    with _lock:
+        connection = _get_connection()
+        (games,) = connection.execute("SELECT COUNT(*) FROM games").fetchone()
+        if games:
+            logging.warning(
+                "The SQLite games table is not empty. Skipping history import."
+            )
+        elif history is not None:
+            for column in history.columns:
+                if column not in ("Date", "Letter", "Points"):
+                    _ensure_category_column(connection, column)
+            rows = [_game_values(row) for row in history.records()]
+            columns = list(rows[0]) if rows else []
+            connection.executemany(
+                f"INSERT INTO games ({', '.join(_quote(c) for c in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                [list(values.values()) for values in rows],
+            )
+            connection.commit()
+            logging.info(f"Imported {len(rows)} games from '{history_file}'.")
+
+    if os.path.isfile(verified_terms_file):
+        with open(verified_terms_file, newline="", encoding="utf-8") as f:
+            terms = [(row["Term"], row["Category"]) for row in csv.DictReader(f)]
+        terms = tombstones.live_rows(
+            verified_terms_file,
+            terms,
+            key=lambda term: (term[1], term[0].casefold()),
+        )
+        with _lock:
+            connection = _get_connection()
+            connection.executemany(
+                "INSERT OR IGNORE INTO verified_terms VALUES (?, ?, ?)",
+                [(term, category, term.casefold()) for term, category in terms],
+            )
+            connection.commit()
+        logging.info(f"Imported verified terms from '{verified_terms_file}'.")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Manage the SQLite storage backend.")
+    parser.add_argument(
+        "--migrate",
+        action="store_true",
+        help="Import game_history.csv and verified_terms.csv into the database.",
+    )
+    args = parser.parse_args()
+    if args.migrate:
+        migrate_from_csv()
+    else:
+        parser.print_help()
@@ -0,0 +1,75 @@
+"""
+Opt-in startup profiling. Import this module before anything else; when
+STARTUP_REPORT_ENV is set or --startup-report is passed, it times every
+module imported afterwards and logs a report once the app is ready.
+"""
+
+import builtins
+import logging
+import os
+import sys
+import time
+
+STARTUP_REPORT_ENV = "CCR_STARTUP_REPORT"
+STARTUP_REPORT_FLAG = "--startup-report"
+REPORT_TOP_MODULES = 15
+
+enabled = bool(os.environ.get(STARTUP_REPORT_ENV)) or STARTUP_REPORT_FLAG in sys.argv
+_process_start = time.perf_counter()
+_last_mark = _process_start
+_original_import = builtins.__import__
+_import_depth = 0
+_import_times = []  # (depth, module name, inclusive seconds)
+_marks = []  # (label, seconds since the previous mark)
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    """Wraps __import__ and records the cost of modules loaded for the first time."""
+    global _import_depth
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    depth = _import_depth
+    _import_depth += 1
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        _import_depth -= 1
+        _import_times.append((depth, name, time.perf_counter() - start))
+
+
+def mark(label):
+    """Records the time spent since the previous mark under a label."""
+    global _last_mark
+    if not enabled:
+        return
+    now = time.perf_counter()
+    _marks.append((label, now - _last_mark))
+    _last_mark = now
+
+
+def report():
+    """Logs per-module import costs and the startup phases, then stops timing."""
+    if not enabled:
+        return
+    builtins.__import__ = _original_import
+    total = time.perf_counter() - _process_start
+
+    lines = [f"Startup report: ready after {total * 1000:.1f} ms"]
+    lines.append("  Slowest imports (inclusive, top-level and direct children):")
+    slowest = sorted(
+        (entry for entry in _import_times if entry[0] <= 1),
+        key=lambda entry: entry[2],
+        reverse=True,
+    )[:REPORT_TOP_MODULES]
+    for depth, name, seconds in slowest:
+        lines.append(f"    {'  ' * depth}{name:<40} {seconds * 1000:8.1f} ms")
+    lines.append("  Phases:")
+    for label, seconds in _marks:
+        lines.append(f"    {label:<42} {seconds * 1000:8.1f} ms")
+    logging.info("\n".join(lines))
+
+
+if enabled:
+    builtins.__import__ = _timed_import
@@ -0,0 +1,163 @@
+"""
+Read-only dictionary of pre-validated terms, consulted before the verified
+terms CSV. The file is built once from a CSV and memory-mapped, so a large
+dictionary costs neither load time nor Python strings:
+
+    header      magic (8 bytes), term count (uint64), category names length (uint32)
+    categories  category names separated by US; bit i of a mask is the i-th name
+    entries     one (string offset uint32, length uint16, category mask uint32)
+                per term, sorted by term
+    strings     casefolded, UTF-8 encoded terms, back to back
+
+Lookups binary-search the entries and compare the terms in place.
+"""
+
+import argparse
+import csv
+import logging
+import mmap
+import os
+import struct
+import tombstones
+from config import CATEGORIES, VERIFIED_TERMS_DICTIONARY_FILE
+
+MAGIC = b"CCRDIC1\0"
+HEADER = struct.Struct("<8sQI")
+ENTRY = struct.Struct("<IHI")
+SEPARATOR = "\x1f"
+MAX_CATEGORIES = 32
+
+
+# === Module-level utility functions ===
+def _make_key(term):
+    """Builds the binary search key for a term, matching the verified terms index."""
+    return str(term).casefold().encode("utf-8")
+
+
+def _read_pairs(path):
+    """Reads the (term, category) rows of a CSV with 'Term' and 'Category' columns."""
+    with open(path, newline="", encoding="utf-8") as f:
+        pairs = [
+            (row["Term"].strip(), row["Category"].strip()) for row in csv.DictReader(f)
+        ]
+    # Terms removed from the verified terms CSV but not compacted away yet
+    return tombstones.live_rows(
+        path, pairs, key=lambda pair: (pair[1], pair[0].casefold())
+    )
+
+
+# === Dictionary Builder ===
+
+
+def build_dictionary(csv_path, output_path):
+    """
+    Compiles a CSV of (Term, Category) rows into the dictionary format.
+    :param csv_path: CSV with 'Term' and 'Category' columns, like verified_terms.csv.
+    :param output_path: Where to write the dictionary file.
+    """
+    masks = {}
+    categories = list(CATEGORIES)
+    for term, category in _read_pairs(csv_path):
+        if not term or not category:
+            continue
+        if category not in categories:
+            categories.append(category)
+        key = _make_key(term)
+        masks[key] = masks.get(key, 0) | (1 << categories.index(category))
+    if len(categories) > MAX_CATEGORIES:
+        raise ValueError(
+            f"The dictionary format supports at most {MAX_CATEGORIES} categories."
+        )
+
+    keys = sorted(masks)
+    names = SEPARATOR.join(categories).encode("utf-8")
+    temp_path = f"{output_path}.tmp"
+    with open(temp_path, "wb") as out:
+        out.write(HEADER.pack(MAGIC, len(keys), len(names)))
+        out.write(names)
+        offset = 0
+        for key in keys:
+            out.write(ENTRY.pack(offset, len(key), masks[key]))
+            offset += len(key)
+        for key in keys:
+            out.write(key)
+    os.replace(temp_path, output_path)
+    logging.info(f"Wrote {len(keys)} terms to dictionary '{output_path}'.")
+    return len(keys)
+
+
+# === Dictionary Reader ===
+
+
+class TermDictionary:
+    """Answers verified-term lookups from a memory-mapped dictionary file."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, names_length = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"'{path}' is not a verified terms dictionary.")
+        names = self._map[HEADER.size : HEADER.size + names_length].decode("utf-8")
+        self._bits = {name: 1 << i for i, name in enumerate(names.split(SEPARATOR))}
+        self._entries = HEADER.size + names_length
+        self._strings = self._entries + self._count * ENTRY.size
+
+    def __len__(self):
+        return self._count
+
+    def _key_at(self, position):
+        """Returns the term stored at a sorted position."""
+        offset, length, _ = ENTRY.unpack_from(
+            self._map, self._entries + position * ENTRY.size
+        )
+        start = self._strings + offset
+        return self._map[start : start + length]
+
+    def _mask_of(self, key):
+        """Returns the category mask of a key, or 0 if it is not in the dictionary."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count and self._key_at(low) == key:
+            return ENTRY.unpack_from(self._map, self._entries + low * ENTRY.size)[2]
+        return 0
+
+    def contains(self, term, category):
+        """Checks if a term is listed for a category, ignoring case."""
+        bit = self._bits.get(category)
+        return bit is not None and bool(self._mask_of(_make_key(term)) & bit)
+
+    def categories_of(self, term):
+        """Returns the categories a term is listed for."""
+        mask = self._mask_of(_make_key(term))
+        return [name for name, bit in self._bits.items() if mask & bit]
+
+    def close(self):
+        """Releases the memory map and the underlying file."""
+        self._map.close()
+        self._file.close()
+
+
+def open_dictionary(path=VERIFIED_TERMS_DICTIONARY_FILE):
+    """Opens the dictionary file, or returns None if there is none."""
+    if not os.path.isfile(path):
+        return None
+    dictionary = TermDictionary(path)
+    logging.info(f"Opened verified terms dictionary with {len(dictionary)} terms.")
+    return dictionary
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(
+        description="Compile a CSV of verified terms into the dictionary format."
+    )
+    parser.add_argument("terms", help="CSV with 'Term' and 'Category' columns.")
+    parser.add_argument("-o", "--output", default=VERIFIED_TERMS_DICTIONARY_FILE)
+    args = parser.parse_args()
+    build_dictionary(args.terms, args.output)
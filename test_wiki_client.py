@@ -0,0 +1,161 @@
+"""
+Tests wiki_client against a local stub of the MediaWiki API. Run with
+'python -m pytest test_wiki_client.py' or 'python -m unittest test_wiki_client'.
+"""
+
+import unittest
+from unittest import mock
+import benchmarks
+import response_cache
+import wiki_client
+import wikipedia_scraper
+from benchmarks import SUMMARIES
+
+# A disambiguation page with a table of contents entry and a nested list
+NESTED_DISAMBIGUATION = (
+    '<ul><li class="toclevel-1 tocsection-1"><a href="#Orte">Orte</a></li></ul>'
+    "<ul><li><a>Mars (Planet)</a>, ein Planet"
+    "<ul><li><a>Mars Express</a>, eine Raumsonde</li></ul></li>"
+    "<li><a>Mars (Gott)</a>, ein Gott</li></ul>"
+)
+
+
+class StubServerTest(unittest.TestCase):
+    """Points wiki_client at the benchmark stub server without rate limiting."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = benchmarks.start_stub_server()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.queries = []
+        self.server.failures = []
+        url = f"http://127.0.0.1:{self.server.server_port}/w/api.php"
+        for name, value in [
+            ("WIKIPEDIA_API_URL", url),
+            ("rate_limiter", wiki_client.TokenBucket(0)),
+        ]:
+            patcher = mock.patch.object(wiki_client, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class PageLookupTest(StubServerTest):
+    def test_page_returns_title_and_summary(self):
+        outcome = wiki_client.page("Berlin")
+        self.assertEqual(outcome, {"title": "Berlin", "summary": SUMMARIES["Berlin"]})
+        # Title, summary and disambiguation flag come back in one request
+        self.assertEqual(len(self.server.queries), 1)
+        self.assertEqual(self.server.queries[0]["prop"], "extracts|pageprops")
+
+    def test_page_follows_redirects(self):
+        self.assertEqual(wiki_client.page("Berlin (Stadt)")["title"], "Berlin")
+
+    def test_missing_page(self):
+        self.assertEqual(wiki_client.page("Atlantis"), {"error": "missing"})
+
+    def test_search_returns_titles(self):
+        self.assertEqual(wiki_client.search("Mars"), ["Mars (Planet)", "Mars (Gott)"])
+
+    def test_auto_suggest_uses_the_suggestion(self):
+        self.assertEqual(wiki_client.page("Dunau", auto_suggest=True)["title"], "Donau")
+
+    def test_auto_suggest_falls_back_to_the_top_result(self):
+        self.assertEqual(wiki_client.page("Berl", auto_suggest=True)["title"], "Berlin")
+
+    def test_auto_suggest_without_results_is_missing(self):
+        outcome = wiki_client.page("Atlantis", auto_suggest=True)
+        self.assertEqual(outcome, {"error": "missing"})
+        self.assertEqual(len(self.server.queries), 1)
+
+    def test_disambiguation_lists_options(self):
+        outcome = wiki_client.page("Mars")
+        self.assertEqual(outcome["error"], "ambiguous")
+        self.assertEqual(outcome["options"], ["Mars (Planet)", "Mars (Gott)"])
+
+    def test_disambiguation_skips_contents_and_keeps_nested_items(self):
+        with mock.patch.dict(benchmarks.DISAMBIGUATIONS, Mars=NESTED_DISAMBIGUATION):
+            outcome = wiki_client.page("Mars")
+        self.assertEqual(
+            outcome["options"], ["Mars (Planet)", "Mars Express", "Mars (Gott)"]
+        )
+
+
+class RetryTest(StubServerTest):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(wiki_client.time, "sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def delays(self):
+        return [call.args[0] for call in self.sleep.call_args_list]
+
+    def test_retries_429_after_the_retry_after_header(self):
+        self.server.failures = [(429, {"Retry-After": "2"}, {})]
+        self.assertEqual(wiki_client.search("Berlin"), ["Berlin"])
+        self.assertEqual(len(self.server.queries), 2)
+        self.assertEqual(self.delays(), [2.0])
+
+    def test_retries_5xx_with_exponential_backoff(self):
+        self.server.failures = [(503, {}, {}), (502, {}, {})]
+        self.assertEqual(wiki_client.page("Donau")["title"], "Donau")
+        backoff = wiki_client.WIKIPEDIA_BACKOFF
+        self.assertEqual(self.delays(), [backoff, backoff * 2])
+
+    def test_gives_up_after_the_last_retry(self):
+        attempts = wiki_client.WIKIPEDIA_MAX_RETRIES + 1
+        self.server.failures = [(500, {}, {})] * attempts
+        with self.assertRaises(wiki_client.WikipediaError):
+            wiki_client.page("Berlin")
+        self.assertEqual(len(self.server.queries), attempts)
+
+    def test_api_errors_are_not_retried(self):
+        self.server.failures = [(200, {}, {"error": {"info": "Bad title"}})]
+        with self.assertRaisesRegex(wiki_client.WikipediaError, "Bad title"):
+            wiki_client.page("Berlin")
+        self.assertEqual(len(self.server.queries), 1)
+
+    def test_unreachable_server_raises(self):
+        with mock.patch.object(
+            wiki_client, "WIKIPEDIA_API_URL", "http://127.0.0.1:9/w/api.php"
+        ):
+            with self.assertRaises(wiki_client.WikipediaError):
+                wiki_client.search("Berlin")
+
+
+class ScraperTest(StubServerTest):
+    """Runs the scraper's fallbacks through the client, bypassing the response cache."""
+
+    def setUp(self):
+        super().setUp()
+        for name, value in [("get", lambda *args: None), ("put", lambda *args: None)]:
+            patcher = mock.patch.object(response_cache, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_missing_page_falls_back_to_search(self):
+        self.assertTrue(wikipedia_scraper.validate_input("Donau-Strom", "River"))
+        searches = [q["srsearch"] for q in self.server.queries if "srsearch" in q]
+        self.assertIn("Donau-Strom", searches)
+
+    def test_disambiguation_checks_the_options(self):
+        # A genuine rejection: every option was fetched and none matched
+        self.assertIs(wikipedia_scraper.validate_input("Mars", "Country"), False)
+        titles = [q["titles"] for q in self.server.queries if "titles" in q]
+        self.assertIn("Mars (Planet)", titles)
+        self.assertIn("Mars (Gott)", titles)
+
+    def test_failed_lookup_is_not_a_rejection(self):
+        with mock.patch.object(wiki_client.time, "sleep"):
+            self.server.failures = [(503, {}, {})] * 20
+            self.assertIsNone(wikipedia_scraper.validate_input("Berlin", "City"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Append-only tombstone logs for the CSV stores. Deleting a row appends one line
+to '<file>.tombstones' instead of rewriting the file; readers filter the
+recorded rows out until a compaction rewrites the file and drops the log.
+
+The first line of a log names the file generation (device and inode) it was
+written for. Rewrites replace a file with a new inode, so a log left behind
+by an interrupted compaction is recognised as stale and ignored.
+"""
+
+import csv
+import io
+import logging
+import os
+import tracing
+
+
+# === Module-level utility functions ===
+def log_path(path):
+    """Returns the tombstone log of a data file."""
+    return f"{path}.tombstones"
+
+
+def _generation(path):
+    """Identifies the current version of a file; rewrites change it, appends don't."""
+    stat = os.stat(path)
+    return f"{stat.st_dev}:{stat.st_ino}"
+
+
+def _read_log(path):
+    """Returns (generation, complete entry lines) of a tombstone log, or None."""
+    try:
+        with open(log_path(path), encoding="utf-8", newline="") as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    lines = text.split("\n")
+    # The last element is empty, or a line torn by a crash mid-append
+    return lines[0], [line for line in lines[1:-1] if line]
+
+
+def _log_generation(path):
+    """Returns the generation a tombstone log was written for, or None."""
+    try:
+        with open(log_path(path), encoding="utf-8", newline="") as f:
+            return f.readline().rstrip("\n")
+    except FileNotFoundError:
+        return None
+
+
+# === Tombstone Log ===
+
+
+def load(path):
+    """Returns the tombstone rows recorded for the current version of a file."""
+    log = _read_log(path)
+    if log is None:
+        return []
+    generation, lines = log
+    try:
+        current = _generation(path)
+    except FileNotFoundError:
+        current = None
+    if generation != current:
+        logging.info(f"Discarding stale tombstones of '{path}'.")
+        clear(path)
+        return []
+    tracing.count("storage.bytes_read", os.path.getsize(log_path(path)))
+    return list(csv.reader(lines))
+
+
+def append(path, row):
+    """Records one deleted row for the current version of a file."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(row)
+    entry = buffer.getvalue()
+
+    generation = _generation(path)
+    if _log_generation(path) != generation:
+        # Start a new log; a stale one belongs to a file that was rewritten
+        entry = f"{generation}\n{entry}"
+        mode = "w"
+    else:
+        mode = "a"
+        _drop_torn_tail(log_path(path))
+    with open(log_path(path), mode, encoding="utf-8", newline="") as f:
+        f.write(entry)
+        f.flush()
+        os.fsync(f.fileno())
+    tracing.count("storage.bytes_written", len(entry.encode("utf-8")))
+
+
+def _drop_torn_tail(tombstone_path):
+    """Truncates a log after its last line break, so appends start a fresh line."""
+    with open(tombstone_path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(0, size - 4096)
+        f.seek(tail_start)
+        tail = f.read()
+        if tail.endswith(b"\n"):
+            return
+        f.truncate(tail_start + tail.rfind(b"\n") + 1)
+
+
+def clear(path):
+    """Removes the tombstone log of a file, e.g. after the file was compacted."""
+    try:
+        os.remove(log_path(path))
+    except FileNotFoundError:
+        pass
+
+
+def live_rows(path, rows, key):
+    """
+    Filters the rows read from a keyed file such as the verified terms. Its
+    tombstones are [*key, row count] entries: each hides the rows with that key
+    among the first `row count` rows, so a row appended later stays visible.
+    """
+    removed_before = {}
+    for entry in load(path):
+        try:
+            entry_key, count = tuple(entry[:-1]), int(entry[-1])
+        except (IndexError, ValueError):
+            continue
+        removed_before[entry_key] = max(removed_before.get(entry_key, 0), count)
+    if not removed_before:
+        return rows
+    return [
+        row
+        for position, row in enumerate(rows)
+        if position >= removed_before.get(key(row), 0)
+    ]
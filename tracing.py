@@ -0,0 +1,240 @@
+"""
+Opt-in tracing for the validation and storage hot paths. When TRACE_ENV is set
+or --trace is passed, spans and counters are appended to TRACE_LOG_FILE as JSON
+lines, one "round" record summarizes each traced phase of a game, and a summary
+is logged on exit. When disabled, `traced` returns functions unchanged and
+`span`/`count` return immediately.
+"""
+
+import atexit
+import functools
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from config import TRACE_LOG_FILE
+
+TRACE_ENV = "CCR_TRACE"
+TRACE_FLAG = "--trace"
+
+enabled = bool(os.environ.get(TRACE_ENV)) or TRACE_FLAG in sys.argv
+
+_lock = threading.Lock()
+_local = threading.local()
+_log_file = None
+_round_ids = itertools.count(1)
+_current_round = None  # {"id", "phase", "counters"} while a round scope is open
+_span_totals = {}  # name -> [count, total seconds, max seconds]
+_counter_totals = {}
+
+
+class _NoopSpan:
+    """Returned by span() when tracing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+# === Output ===
+def _write(record):
+    """Appends one JSON record to the trace log."""
+    global _log_file
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _lock:
+        if _log_file is None:
+            _log_file = open(TRACE_LOG_FILE, "a", encoding="utf-8")
+        _log_file.write(line + "\n")
+        _log_file.flush()
+
+
+# === Spans ===
+class _Span:
+    """Times a block and records it under the current round and parent span."""
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self):
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        self.parent = stack[-1] if stack else None
+        stack.append(self.name)
+        self.start = time.perf_counter()
+        self.wall_start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self.start
+        _local.stack.pop()
+        with _lock:
+            totals = _span_totals.setdefault(self.name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            totals[2] = max(totals[2], duration)
+        current = _current_round
+        record = {
+            "type": "span",
+            "name": self.name,
+            "round": current["id"] if current else None,
+            "parent": self.parent,
+            "thread": threading.current_thread().name,
+            "start": self.wall_start,
+            "duration_ms": duration * 1000,
+            **self.attrs,
+        }
+        if exc_type is not None:
+            record["error"] = exc_type.__name__
+        _write(record)
+        return False
+
+
+def span(name, **attrs):
+    """Returns a context manager that records how long its block takes."""
+    if not enabled:
+        return _NOOP_SPAN
+    return _Span(name, attrs)
+
+
+def traced(name=None):
+    """Decorator that wraps a function in a span; a no-op when tracing is off."""
+
+    def decorate(func):
+        if not enabled:
+            return func
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+# === Counters ===
+def count(name, amount=1):
+    """Adds to a counter, e.g. 'network.calls' or 'response_cache.hit'."""
+    if not enabled:
+        return
+    with _lock:
+        _counter_totals[name] = _counter_totals.get(name, 0) + amount
+        current = _current_round
+        if current is not None:
+            counters = current["counters"]
+            counters[name] = counters.get(name, 0) + amount
+
+
+def _hit_ratios(counters):
+    """Returns hit/(hit+miss) for every '<cache>.hit' / '<cache>.miss' pair."""
+    ratios = {}
+    for name in counters:
+        if name.endswith(".hit"):
+            cache = name[: -len(".hit")]
+            hits = counters[name]
+            total = hits + counters.get(f"{cache}.miss", 0)
+            ratios[cache] = hits / total if total else 0.0
+    for name in counters:
+        if name.endswith(".miss") and name[: -len(".miss")] not in ratios:
+            ratios[name[: -len(".miss")]] = 0.0
+    return ratios
+
+
+# === Rounds ===
+def new_round_id():
+    """Returns an id that ties the traced phases of one game together."""
+    return next(_round_ids)
+
+
+class _RoundScope:
+    """Collects counters for one phase of a round and writes a round record."""
+
+    def __init__(self, round_id, phase):
+        self.round_id = round_id
+        self.phase = phase
+
+    def __enter__(self):
+        global _current_round
+        self.outer = _current_round
+        _current_round = {"id": self.round_id, "phase": self.phase, "counters": {}}
+        self.round = _current_round
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        global _current_round
+        duration = time.perf_counter() - self.start
+        _current_round = self.outer
+        counters = self.round["counters"]
+        _write(
+            {
+                "type": "round",
+                "round": self.round_id,
+                "phase": self.phase,
+                "duration_ms": duration * 1000,
+                "counters": counters,
+                "hit_ratios": _hit_ratios(counters),
+            }
+        )
+        return False
+
+
+def round_scope(round_id, phase):
+    """Attributes spans and counters inside the block to one phase of a round."""
+    if not enabled:
+        return _NOOP_SPAN
+    return _RoundScope(round_id, phase)
+
+
+# === Summary ===
+def summary():
+    """Returns the aggregated span timings, counters and cache hit ratios."""
+    with _lock:
+        spans = {
+            name: {
+                "count": n,
+                "total_ms": total * 1000,
+                "mean_ms": total / n * 1000,
+                "max_ms": longest * 1000,
+            }
+            for name, (n, total, longest) in _span_totals.items()
+        }
+        counters = dict(_counter_totals)
+    return {"spans": spans, "counters": counters, "hit_ratios": _hit_ratios(counters)}
+
+
+def dump_summary():
+    """Logs the summary and appends it to the trace log."""
+    data = summary()
+    if not data["spans"] and not data["counters"]:
+        return
+    _write({"type": "summary", **data})
+    lines = ["Trace summary:"]
+    for name, stats in sorted(
+        data["spans"].items(), key=lambda item: item[1]["total_ms"], reverse=True
+    ):
+        lines.append(
+            f"  {name:<45} {stats['count']:>6}x  total {stats['total_ms']:9.1f} ms"
+            f"  mean {stats['mean_ms']:8.2f} ms  max {stats['max_ms']:8.2f} ms"
+        )
+    for name, value in sorted(data["counters"].items()):
+        lines.append(f"  {name:<45} {value:>10}")
+    for cache, ratio in sorted(data["hit_ratios"].items()):
+        lines.append(f"  {cache + ' hit ratio':<45} {ratio:>10.1%}")
+    logging.info("\n".join(lines))
+
+
+if enabled:
+    atexit.register(dump_summary)
@@ -0,0 +1,247 @@
+"""
+Minimal MediaWiki API client used by the scraper. All requests go through one
+pooled HTTP session, a shared token bucket and a retry loop with backoff.
+Point WIKIPEDIA_API_URL at a local server to run the scraper against a stub.
+"""
+
+import logging
+import threading
+import time
+from html.parser import HTMLParser
+import tracing
+from config import (
+    WIKIPEDIA_API_URL,
+    WIKIPEDIA_BACKOFF,
+    WIKIPEDIA_LANGUAGE,
+    WIKIPEDIA_MAX_RETRIES,
+    WIKIPEDIA_POOL_SIZE,
+    WIKIPEDIA_RATE_BURST,
+    WIKIPEDIA_RATE_LIMIT,
+    WIKIPEDIA_TIMEOUT,
+    WIKIPEDIA_USER_AGENT,
+)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+SEARCH_RESULTS = 10
+
+_session = None
+_session_lock = threading.Lock()
+
+
+class WikipediaError(Exception):
+    """Raised when the API cannot be reached or answers with an error."""
+
+
+# === Rate Limiting ===
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills `rate` tokens per second up to `capacity`.
+    A rate of 0 or less disables limiting.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token now; a negative balance is the caller's wait time.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+rate_limiter = TokenBucket(WIKIPEDIA_RATE_LIMIT, WIKIPEDIA_RATE_BURST)
+
+
+# === Transport ===
+
+
+def _get_session():
+    """Creates the shared keep-alive session on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            # requests is only needed once a lookup misses every cache.
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=WIKIPEDIA_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = WIKIPEDIA_USER_AGENT
+            _session = session
+    return _session
+
+
+def _retry_delay(response, attempt):
+    """Returns the wait before the next attempt, honouring a Retry-After header."""
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+    return WIKIPEDIA_BACKOFF * 2**attempt
+
+
+def _request(params):
+    """Sends one API query and returns the decoded JSON, retrying transient errors."""
+    import requests
+
+    session = _get_session()
+    url = WIKIPEDIA_API_URL.format(language=WIKIPEDIA_LANGUAGE)
+    params = {"format": "json", "action": "query", **params}
+    for attempt in range(WIKIPEDIA_MAX_RETRIES + 1):
+        rate_limiter.acquire()
+        response = None
+        tracing.count("network.calls")
+        try:
+            with tracing.span("http.get", attempt=attempt):
+                response = session.get(url, params=params, timeout=WIKIPEDIA_TIMEOUT)
+        except requests.RequestException as e:
+            error = e
+        else:
+            if response.status_code not in RETRY_STATUS_CODES:
+                break
+            error = f"HTTP {response.status_code}"
+        if attempt == WIKIPEDIA_MAX_RETRIES:
+            raise WikipediaError(
+                f"Request failed after {attempt + 1} attempts: {error}"
+            )
+        tracing.count("network.retries")
+        delay = _retry_delay(response, attempt)
+        logging.debug(
+            f"Wikipedia request failed ({error}), retrying in {delay:.1f}s..."
+        )
+        time.sleep(delay)
+
+    tracing.count("network.bytes_read", len(response.content))
+    if response.status_code != 200:
+        raise WikipediaError(f"HTTP {response.status_code}")
+    data = response.json()
+    if "error" in data:
+        raise WikipediaError(data["error"].get("info", "Unknown API error"))
+    return data
+
+
+# === Disambiguation Pages ===
+
+
+class _OptionParser(HTMLParser):
+    """Collects the text of the first link in each list item of a page."""
+
+    def __init__(self):
+        super().__init__()
+        self.items = []  # [is_toc_entry, link text or None] in document order
+        self._open_items = []
+        self._capturing = None  # Items whose first link is being read
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "li":
+            item = ["tocsection" in (dict(attrs).get("class") or ""), None]
+            self.items.append(item)
+            self._open_items.append(item)
+        elif tag == "a" and self._capturing is None:
+            self._capturing = [item for item in self._open_items if item[1] is None]
+            for item in self._capturing:
+                item[1] = ""
+
+    def handle_endtag(self, tag):
+        if tag == "li" and self._open_items:
+            self._open_items.pop()
+        elif tag == "a":
+            self._capturing = None
+
+    def handle_data(self, data):
+        for item in self._capturing or ():
+            item[1] += data
+
+    def options(self):
+        return [text for is_toc, text in self.items if not is_toc and text is not None]
+
+
+def _disambiguation_options(title):
+    """Returns the link texts listed on a disambiguation page."""
+    data = _request({"action": "parse", "page": title, "prop": "text", "redirects": ""})
+    parser = _OptionParser()
+    parser.feed(data["parse"]["text"]["*"])
+    return parser.options()
+
+
+# === Public API ===
+
+
+def search(query, results=SEARCH_RESULTS):
+    """Returns the titles of the top search results."""
+    data = _request(
+        {"list": "search", "srprop": "", "srlimit": results, "srsearch": query}
+    )
+    return [result["title"] for result in data["query"]["search"]]
+
+
+def _suggest(query):
+    """Returns the search suggestion or top result for a query, or None."""
+    data = _request(
+        {
+            "list": "search",
+            "srprop": "",
+            "srlimit": 1,
+            "srinfo": "suggestion",
+            "srsearch": query,
+        }
+    )
+    suggestion = data["query"].get("searchinfo", {}).get("suggestion")
+    results = data["query"]["search"]
+    return suggestion or (results[0]["title"] if results else None)
+
+
+def page(title, auto_suggest=False):
+    """
+    Looks up a page and returns a cacheable outcome: {"title", "summary"},
+    {"error": "missing"} or {"error": "ambiguous", "options": [...]}.
+    Redirects are followed. Title, summary and the disambiguation flag come
+    back in a single request.
+    """
+    if auto_suggest:
+        title = _suggest(title)
+        if title is None:
+            return {"error": "missing"}
+
+    data = _request(
+        {
+            "prop": "extracts|pageprops",
+            "ppprop": "disambiguation",
+            "exintro": "",
+            "explaintext": "",
+            "redirects": "",
+            "titles": title,
+        }
+    )
+    pages = data["query"].get("pages", {})
+    if not pages:
+        return {"error": "missing"}
+    result = next(iter(pages.values()))
+    if "missing" in result or "invalid" in result:
+        return {"error": "missing"}
+    if "disambiguation" in result.get("pageprops", {}):
+        return {
+            "error": "ambiguous",
+            "options": _disambiguation_options(result["title"]),
+        }
+    return {"title": result["title"], "summary": result.get("extract", "")}
@@ -1,128 +1,400 @@
-import wikipedia
+import contextvars
 import logging
 import re
-from config import VALIDATION_KEYWORDS
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+import response_cache
+import offline_index
+import tracing
+import wiki_client
+from config import (
+    BATCH_VALIDATION_RATE,
+    VALIDATION_BACKEND,
+    VALIDATION_KEYWORDS,
+    VALIDATION_MAX_WORKERS,
+    WIKIPEDIA_LANGUAGE,
+)
 
-wikipedia.set_lang("de")
+
+class PageMissing(Exception):
+    """Raised when no Wikipedia page exists for a title."""
+
+
+class PageAmbiguous(Exception):
+    """Raised when a title resolves to a disambiguation page."""
+
+    def __init__(self, title, options):
+        super().__init__(f"'{title}' may refer to several pages.")
+        self.title = title
+        self.options = options
+
+
+class CachedPage:
+    """A Wikipedia page reduced to the fields the validator needs."""
+
+    def __init__(self, title, summary):
+        self.title = title
+        self.summary = summary
+
+
+# === Response helpers ===
+def _replay_page(title, outcome):
+    """Turns a page outcome back into a page object or the matching exception."""
+    error = outcome.get("error")
+    if error == "missing":
+        raise PageMissing(title)
+    if error == "ambiguous":
+        raise PageAmbiguous(title, outcome["options"])
+    return CachedPage(outcome["title"], outcome["summary"])
+
+
+class _Flight:
+    """A lookup in progress that concurrent callers with the same key wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+_flights = {}  # (operation, query) -> _Flight
+_flights_lock = threading.Lock()
+# (operation, query) -> response while a validation round is running, else None.
+# A context variable, so concurrent rounds in other threads keep their own memo.
+_round_responses = contextvars.ContextVar("round_responses", default=None)
+
+
+@contextmanager
+def validation_round():
+    """
+    Memoizes every lookup made inside the block, so one round never repeats a
+    request. Nested rounds and work started with submit_in_round share the
+    outermost memo; rounds running elsewhere at the same time do not.
+    """
+    if _round_responses.get() is not None:
+        yield
+        return
+    token = _round_responses.set({})
+    try:
+        yield
+    finally:
+        _round_responses.reset(token)
+
+
+def submit_in_round(executor, function, *args):
+    """Submits a call to an executor so it runs inside the caller's round."""
+    return executor.submit(contextvars.copy_context().run, function, *args)
+
+
+def _single_flight(key, loader):
+    """Runs loader once for all concurrent callers with the same key."""
+    with _flights_lock:
+        flight = _flights.get(key)
+        is_leader = flight is None
+        if is_leader:
+            flight = _flights[key] = _Flight()
+
+    if not is_leader:
+        logging.debug(f"Joining in-flight '{key[0]}' lookup for '{key[1]}'.")
+        tracing.count("single_flight.joined")
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = loader()
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+    return flight.result
+
+
+def _lookup(operation, query, download):
+    """
+    Returns a response from the round memo, a concurrent identical request,
+    the response cache or the network, in that order.
+    """
+    key = (operation, query)
+    memo = _round_responses.get()
+    if memo is not None and key in memo:
+        tracing.count("round_memo.hit")
+        return memo[key]
+
+    def load():
+        response = response_cache.get(WIKIPEDIA_LANGUAGE, operation, query)
+        if response is None:
+            tracing.count("response_cache.miss")
+            response = download()
+            response_cache.put(WIKIPEDIA_LANGUAGE, operation, query, response)
+        else:
+            tracing.count("response_cache.hit")
+            logging.debug(f"Using cached '{operation}' response for '{query}'.")
+        return response
+
+    response = _single_flight(key, load)
+    if memo is not None:
+        memo[key] = response
+    return response
+
+
+def _fetch_page(title, auto_suggest=False):
+    """Returns a page summary, fetching each title at most once at a time."""
+    if VALIDATION_BACKEND == "offline":
+        return _replay_page(title, offline_index.get_index().page(title, auto_suggest))
+
+    operation = "page_suggest" if auto_suggest else "page"
+    with tracing.span(f"scraper.{operation}", title=title):
+        outcome = _lookup(
+            operation, title, lambda: wiki_client.page(title, auto_suggest)
+        )
+    return _replay_page(title, outcome)
+
+
+def _search(term):
+    """Returns Wikipedia search results, sharing identical concurrent searches."""
+    if VALIDATION_BACKEND == "offline":
+        return offline_index.get_index().search(term)
+    with tracing.span("scraper.search", term=term):
+        return _lookup("search", term, lambda: wiki_client.search(term))
 
 
 def _find_best_page(term):
     """
     Tries to find a Wikipedia page with a more robust, prioritized strategy.
-    Lets DisambiguationError propagate.
+    Lets PageAmbiguous propagate.
     """
     try:
         # Try a direct match first. This is the most reliable.
-        return wikipedia.page(term, auto_suggest=False)
-    except wikipedia.exceptions.PageError:
+        return _fetch_page(term, auto_suggest=False)
+    except PageMissing:
         try:
             # If that fails, try with auto_suggest for typos.
             logging.debug(f"Direct match for '{term}' failed, trying auto-suggest...")
-            return wikipedia.page(term, auto_suggest=True)
-        except wikipedia.exceptions.PageError:
+            return _fetch_page(term, auto_suggest=True)
+        except PageMissing:
             # As a last resort, search and take the top result.
             logging.debug(f"Auto-suggest for '{term}' failed, trying a search...")
-            search_results = wikipedia.search(term)
+            search_results = _search(term)
             if not search_results:
                 return None
             try:
-                return wikipedia.page(search_results[0], auto_suggest=False)
-            except Exception:
+                return _fetch_page(search_results[0], auto_suggest=False)
+            except (PageMissing, PageAmbiguous):
                 return None
 
 
+@tracing.traced("scraper.validate_input")
 def validate_input(term, category):
     """
     Validates a given term against a category using the German Wikipedia.
     Handles typos and disambiguation intelligently with a fallback search.
+    Returns None instead of a verdict if a lookup failed, e.g. because
+    Wikipedia could not be reached.
     """
     if not term:
         return False
+    return classify_term(term, [category])[category]
 
-    wikipedia.set_lang("de")
 
-    def _check_options(options_list):
-        """Helper to loop through a list of page titles and validate the first match."""
+@tracing.traced("scraper.classify_term")
+def classify_term(term, categories=None):
+    """
+    Validates a term against several categories with one set of lookups.
+    The best page and the fallback options are fetched once, and each summary
+    is checked for every category still undecided. For a single category the
+    lookups and log messages are those of a sequential check.
+    :param categories: Categories to check, all configured ones by default.
+    :return: {category: is_valid}. is_valid is None if a lookup failed before
+        the category could be confirmed.
+    """
+    categories = list(VALIDATION_KEYWORDS if categories is None else categories)
+    verdicts = {category: False for category in categories}
+    if not term:
+        return verdicts
+    lookup_failed = False
+    failure = None
+
+    def undecided():
+        """Returns the categories no page has confirmed yet."""
+        return [category for category in categories if not verdicts[category]]
+
+    @tracing.traced("scraper.options")
+    def check_options(options_list):
+        """Checks options in order until every category is decided."""
+        nonlocal lookup_failed
         for option in options_list:
             try:
-                page = wikipedia.page(option, auto_suggest=False)
+                page = _fetch_page(option, auto_suggest=False)
+            except (PageMissing, PageAmbiguous):
+                continue
+            except Exception as e:
+                logging.warning(f"Lookup of option '{option}' for '{term}' failed: {e}")
+                lookup_failed = True
+                continue
+            for category in undecided():
                 if check_summary_for_keywords(
                     page.summary, category, option, is_checking_option=True
                 ):
+                    verdicts[category] = True
                     logging.info(
                         f"Validation successful. Chose '{option}' for '{term}'."
                     )
-                    return True
-            except Exception:
-                continue
-        return False
+            if not undecided():
+                return
 
-    try:
-        # This might raise DisambiguationError, which is handled below.
-        page = _find_best_page(term)
+    with validation_round():
+        try:
+            # This might raise PageAmbiguous, which is handled below.
+            page = _find_best_page(term)
 
-        # If a page was found, check it first.
-        if page and check_summary_for_keywords(page.summary, category, term):
-            return True
+            # If a page was found, check it first.
+            if page:
+                for category in categories:
+                    verdicts[category] = check_summary_for_keywords(
+                        page.summary, category, term
+                    )
+                if not undecided():
+                    return verdicts
 
-        # If the direct page was wrong or not found, we can still
-        # perform a search and check the results as a fallback.
-        logging.info(
-            f"Initial check for '{term}' failed. Performing a targeted search..."
-        )
-        search_results = wikipedia.search(term)
-        if search_results and _check_options(search_results):
-            return True
+            # If the direct page was wrong or not found, we can still
+            # perform a search and check the results as a fallback.
+            logging.info(
+                f"Initial check for '{term}' failed. Performing a targeted search..."
+            )
+            search_results = _search(term)
+            if search_results:
+                check_options(search_results)
+            failure = "No suitable page found."
 
-        # If we're here, nothing has worked.
-        logging.warning(f"Validation failed for '{term}': No suitable page found.")
-        return False
+        except PageAmbiguous as e:
+            # This handles cases where the term itself is a disambiguation page.
+            logging.info(f"'{term}' is ambiguous. Checking options: {e.options[:5]}...")
+            check_options(e.options)
+            failure = "No suitable option found in disambiguation."
 
-    except wikipedia.exceptions.DisambiguationError as e:
-        # This handles cases where the term itself is a disambiguation page.
-        logging.info(f"'{term}' is ambiguous. Checking options: {e.options[:5]}...")
-        if _check_options(e.options):
-            return True
+        except Exception as e:
+            logging.error(
+                f"An unexpected error occurred during validation for '{term}': {e}"
+            )
+            lookup_failed = True
 
-        logging.warning(
-            f"Validation failed for '{term}': No suitable option found in disambiguation."
-        )
-        return False
-
-    except Exception as e:
+    rejected = undecided()
+    if lookup_failed and rejected:
+        # Without every lookup, a missing match is no proof the term is wrong
         logging.error(
-            f"An unexpected error occurred during validation for '{term}': {e}"
+            f"Could not validate '{term}' as {', '.join(rejected)}: a lookup failed."
         )
-        return False
+        verdicts.update(dict.fromkeys(rejected))
+    elif rejected:
+        logging.warning(f"Validation failed for '{term}': {failure}")
+    return verdicts
+
+
+def validate_many(
+    terms_by_category,
+    max_workers=VALIDATION_MAX_WORKERS,
+    rate_limit=BATCH_VALIDATION_RATE,
+    on_result=None,
+):
+    """
+    Validates many terms in parallel, starting at most rate_limit lookups per second.
+    :param terms_by_category: {category: [term, ...]}. Duplicates are checked once.
+    :param on_result: Optional function called with (category, term, is_valid) as
+        soon as each verdict is known. It is called from the calling thread.
+    :return: {category: {term: is_valid}}. is_valid is None if a lookup failed.
+    """
+    results = {category: {} for category in terms_by_category}
+    # Each distinct term is classified once for all categories it was listed under
+    categories_by_term = {}
+    for category, terms in terms_by_category.items():
+        for term in terms:
+            if term and category not in categories_by_term.setdefault(term, []):
+                categories_by_term[term].append(category)
+    if not categories_by_term:
+        return results
+
+    throttle = wiki_client.TokenBucket(rate_limit)
+
+    def run(term, categories):
+        throttle.acquire()
+        return classify_term(term, categories)
+
+    with validation_round(), ThreadPoolExecutor(
+        max_workers=min(max_workers, len(categories_by_term))
+    ) as executor:
+        futures = {
+            submit_in_round(executor, run, term, categories): term
+            for term, categories in categories_by_term.items()
+        }
+        for future in as_completed(futures):
+            term = futures[future]
+            for category, is_valid in future.result().items():
+                results[category][term] = is_valid
+                if on_result:
+                    on_result(category, term, is_valid)
+    return results
+
+
+def _compile_keyword_matchers(validation_keywords):
+    """
+    Compiles each category's keywords into a single alternation pattern, plus
+    one pattern per keyword in checking order: whole words, then suffixes.
+    Returns {category: (pattern, [(strategy, keyword, keyword_pattern), ...])}.
+    """
+    matchers = {}
+    for category, strategies in validation_keywords.items():
+        ordered = []
+        for keyword in strategies.get("whole_words", []):
+            escaped = re.escape(keyword.lower())
+            ordered.append(("whole word", keyword, rf"\b{escaped}\b"))
+        for keyword in strategies.get("suffixes", []):
+            # This pattern looks for a word ending with the keyword.
+            escaped = re.escape(keyword.lower())
+            ordered.append(("suffix", keyword, rf"\w+{escaped}\b"))
+        if ordered:
+            pattern = re.compile("|".join(source for _, _, source in ordered))
+            keywords = [(s, k, re.compile(source)) for s, k, source in ordered]
+            matchers[category] = (pattern, keywords)
+    return matchers
+
+
+def _first_matching_keyword(keywords, summary_lower):
+    """
+    Returns (strategy, keyword) of the first keyword in checking order that
+    occurs in the summary, which is the one the log reports.
+    """
+    for strategy, keyword, pattern in keywords:
+        if pattern.search(summary_lower):
+            return strategy, keyword
+    return None
+
+
+KEYWORD_MATCHERS = _compile_keyword_matchers(VALIDATION_KEYWORDS)
 
 
 def check_summary_for_keywords(summary, category, term_used, is_checking_option=False):
     """
-    Helper function to check if a summary contains required keywords using multiple matching strategies.
+    Helper function to check if a summary contains required keywords.
+    Scans the summary once with the category's precompiled keyword pattern.
+    Only a logged success looks up which keyword matched first.
     """
     summary_lower = summary.lower()
-    keyword_strategies = VALIDATION_KEYWORDS.get(category, {})
-
-    # Whole Word Matching
-    for keyword in keyword_strategies.get("whole_words", []):
-        pattern = r"\b" + re.escape(keyword.lower()) + r"\b"
-        if re.search(pattern, summary_lower):
-            if not is_checking_option:
-                logging.info(
-                    f"Validation successful for '{term_used}' (whole word: '{keyword}')."
-                )
-            return True
-
-    # Suffix Matching
-    for keyword in keyword_strategies.get("suffixes", []):
-        # This pattern looks for a word ending with the keyword.
-        pattern = r"\w+" + re.escape(keyword.lower()) + r"\b"
-        if re.search(pattern, summary_lower):
-            if not is_checking_option:
-                logging.info(
-                    f"Validation successful for '{term_used}' (suffix: '{keyword}')."
-                )
-            return True
+    matcher = KEYWORD_MATCHERS.get(category)
+
+    match = matcher[0].search(summary_lower) if matcher else None
+    if match:
+        if not is_checking_option:
+            strategy, keyword = _first_matching_keyword(matcher[1], summary_lower)
+            logging.info(
+                f"Validation successful for '{term_used}' ({strategy}: '{keyword}')."
+            )
+        return True
 
     if not is_checking_option:
         logging.warning(